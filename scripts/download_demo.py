@@ -16,7 +16,11 @@ sys.path.append(str(Path(__file__).parent.parent))
 from rich.console import Console
 from rich.panel import Panel
 
-from src.downloader import ArxivDownloader, download_papers_by_category
+from src.downloader import (
+    ArxivDownloader,
+    close_shared_session,
+    download_papers_by_category
+)
 from src.config import RAW_DATA_DIR
 
 console = Console()
@@ -114,6 +118,8 @@ async def main():
         successful = sum(1 for _, path in results if path is not None)
         console.print(f"\n📊 Final Results: {successful}/{len(results)} papers downloaded")
     
+    await close_shared_session()
+    
     console.print(
         Panel.fit(
             "[bold green]Next Steps[/bold green]\n\n"
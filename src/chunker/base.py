@@ -269,3 +269,27 @@ class TokenCounter:
         except Exception as e:
             logger.warning(f"Token counting failed, using fallback: {e}")
             return int(len(text.split()) * 0.75)
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for several texts with a single encoder call.
+
+        Args:
+            texts: The texts to count tokens for
+
+        Returns:
+            Number of tokens in each text, in the same order
+        """
+        if not texts:
+            return []
+
+        if self.encoder == "fallback":
+            return [int(len(text.split()) * 0.75) for text in texts]
+
+        try:
+            encoded = self.encoder.encode_batch(list(texts))
+            return [len(tokens) for tokens in encoded]
+        except Exception as e:
+            # Fall back to per-text counting so one bad text doesn't
+            # degrade the whole batch
+            logger.debug(f"Batch token counting failed: {e}")
+            return [self.count_tokens(text) for text in texts]
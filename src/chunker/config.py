@@ -55,7 +55,12 @@ DEFAULT_CHUNKING_CONFIG = {
             "similarity_threshold": 0.8,
             "min_chunk_size": 200,
             "max_chunk_size": 2000,
-            "batch_size": 32
+            "batch_size": 32,
+            "precision": "auto",
+            "backend": "torch",
+            "embedding_cache_path": str(
+                DATA_CHUNKS_PATH.parent / "cache" / "semantic_embeddings.db"
+            )
         }
     },
     "output_format": "json",
@@ -0,0 +1,211 @@
+"""Persistent embedding cache for semantic chunking.
+
+Embeddings are pure functions of (model, text), so re-chunking the same
+corpus (e.g. while sweeping similarity thresholds) can reuse vectors
+computed on previous runs instead of running the model again.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """SQLite-backed cache of embeddings keyed by SHA-256(model, text).
+
+    Vectors are stored as float16 to halve disk and memory bandwidth.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the cache.
+
+        Args:
+            path: Location of the SQLite database file
+        """
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Pickle only the path, e.g. for process pool workers.
+
+        The connection and lock can't be pickled; the unpickled cache
+        opens its own connection on first use.
+        """
+        return {'path': self.path}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Restore a cache pickled by __getstate__."""
+        self.__init__(state['path'])
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazily open the database, creating it if needed."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path), check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> bytes:
+        """Build the cache key for a (model, text) pair."""
+        return hashlib.sha256(f"{model_name}\0{text}".encode()).digest()
+
+    def get_many(
+        self, model_name: str, texts: Sequence[str]
+    ) -> List[Optional[np.ndarray]]:
+        """Look up embeddings for a batch of texts.
+
+        Args:
+            model_name: Name of the embedding model
+            texts: Texts to look up
+
+        Returns:
+            List aligned with texts, None for cache misses
+        """
+        keys = [self.make_key(model_name, text) for text in texts]
+        found = {}
+        with self._lock:
+            # Stay below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self.conn.execute(
+                    f"SELECT key, vec FROM embeddings "
+                    f"WHERE key IN ({placeholders})",
+                    batch
+                )
+                found.update(rows)
+
+        return [
+            np.frombuffer(found[key], dtype=np.float16)
+            if key in found else None
+            for key in keys
+        ]
+
+    def set_many(
+        self,
+        model_name: str,
+        texts: Sequence[str],
+        vectors: np.ndarray
+    ) -> None:
+        """Store embeddings for a batch of texts.
+
+        Args:
+            model_name: Name of the embedding model
+            texts: Texts the vectors were computed from
+            vectors: Array of shape (len(texts), dim)
+        """
+        vectors = np.asarray(vectors, dtype=np.float16)
+        rows = [
+            (self.make_key(model_name, text), vector.tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                rows
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class CachedEmbeddings:
+    """LangChain-compatible embeddings wrapper backed by an EmbeddingCache.
+
+    Only texts missing from the cache are sent to the wrapped embeddings.
+    """
+
+    def __init__(self, embeddings, cache: EmbeddingCache, model_name: str):
+        """Initialize the wrapper.
+
+        Args:
+            embeddings: LangChain embeddings object to delegate misses to
+            cache: Persistent embedding cache
+            model_name: Model name used to namespace cache keys
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model_name = model_name
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, computing only those not already cached."""
+        if not texts:
+            return []
+
+        cached = self.cache.get_many(self.model_name, texts)
+        miss_idx = [i for i, vec in enumerate(cached) if vec is None]
+
+        if miss_idx:
+            miss_texts = [texts[i] for i in miss_idx]
+            new = np.asarray(
+                self.embeddings.embed_documents(miss_texts)
+            ).astype(np.float16)
+            self.cache.set_many(self.model_name, miss_texts, new)
+            for j, i in enumerate(miss_idx):
+                cached[i] = new[j]
+
+            logger.debug(
+                f"Embedding cache: {len(texts) - len(miss_idx)} hits, "
+                f"{len(miss_idx)} misses"
+            )
+
+        return np.stack(cached).astype(np.float32).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query text."""
+        return self.embed_documents([text])[0]
+
+
+class PrefetchedEmbeddings:
+    """LangChain-compatible embeddings wrapper serving precomputed vectors.
+
+    Used to embed the sentences of many documents in one batched call and
+    then hand each document's vectors to the splitter without recomputing.
+    """
+
+    def __init__(self, embeddings, vectors: Dict[str, List[float]]):
+        """Initialize the wrapper.
+
+        Args:
+            embeddings: LangChain embeddings object to delegate misses to
+            vectors: Precomputed embeddings keyed by text
+        """
+        self.embeddings = embeddings
+        self.vectors = vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, computing only those not prefetched."""
+        vectors = self.vectors
+        misses = list(dict.fromkeys(
+            text for text in texts if text not in vectors
+        ))
+        if misses:
+            vectors.update(
+                zip(misses, self.embeddings.embed_documents(misses))
+            )
+        return [vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query text."""
+        return self.embed_documents([text])[0]
@@ -4,7 +4,7 @@ This strategy splits documents into chunks of a fixed token count,
 providing a simple baseline for comparison with other strategies.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import logging
 
 from ..base import ChunkingStrategy, TokenCounter, ChunkingError
@@ -14,6 +14,9 @@ from ..utils import clean_text
 
 logger = logging.getLogger(__name__)
 
+# Characters where a chunk may end without cutting a word
+_BREAK_CHARS = frozenset({' ', '\n', '\r', '\t', '.', '!', '?', ';', ','})
+
 
 class FixedSizeChunker(ChunkingStrategy):
     """Fixed-size token-based chunking strategy.
@@ -78,13 +81,14 @@ class FixedSizeChunker(ChunkingStrategy):
                 return []
 
             # Split text using character-based estimation (4:1 ratio)
-            chunks = self._split_text_by_chars(text)
+            spans = self._split_text_spans(text)
 
-            # Create DocumentChunk objects
+            # Create DocumentChunk objects, materializing each chunk's
+            # text only once from its span
             document_chunks = []
-            for i, chunk_text in enumerate(chunks):
+            for i, (start, end) in enumerate(spans):
                 chunk = self._create_document_chunk(
-                    document, chunk_text, i
+                    document, text[start:end], i, start
                 )
                 document_chunks.append(chunk)
 
@@ -115,40 +119,59 @@ class FixedSizeChunker(ChunkingStrategy):
         Returns:
             List of text chunks
         """
-        if len(text) <= self.chunk_size_chars:
-            return [text]
+        return [text[start:end] for start, end in self._split_text_spans(text)]
+
+    def _split_text_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Compute chunk boundaries as (start, end) offsets into text.
+
+        Works on indices only, so no intermediate substrings are created
+        while sliding the window. Spans exclude leading and trailing
+        whitespace and empty chunks are skipped.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of (start, end) character offsets
+        """
+        text_length = len(text)
+        if text_length <= self.chunk_size_chars:
+            return [(0, text_length)]
 
-        chunks = []
+        spans = []
         start = 0
 
-        while start < len(text):
+        while start < text_length:
             # Calculate end position for this chunk
-            end = min(start + self.chunk_size_chars, len(text))
+            end = min(start + self.chunk_size_chars, text_length)
 
             # Try to break at word boundaries if we're not at the end
-            if end < len(text):
+            if end < text_length:
                 # Look backwards for a good break point
-                break_chars = {' ', '\n', '\r', '\t', '.', '!', '?', ';', ','}
                 search_start = max(start, end - 100)  # Don't search too far
 
                 for i in range(end - 1, search_start - 1, -1):
-                    if text[i] in break_chars:
+                    if text[i] in _BREAK_CHARS:
                         end = i + 1
                         break
 
-            # Extract chunk text
-            chunk_text = text[start:end].strip()
+            # Trim surrounding whitespace without copying the chunk
+            chunk_start, chunk_end = start, end
+            while chunk_start < chunk_end and text[chunk_start].isspace():
+                chunk_start += 1
+            while chunk_end > chunk_start and text[chunk_end - 1].isspace():
+                chunk_end -= 1
 
-            if chunk_text:  # Only add non-empty chunks
-                chunks.append(chunk_text)
+            if chunk_start < chunk_end:  # Only add non-empty chunks
+                spans.append((chunk_start, chunk_end))
 
             # Calculate next start position (no overlap for fixed-size)
-            if end >= len(text):
+            if end >= text_length:
                 break
 
             start = end
 
-        return chunks
+        return spans
 
     def _split_text_by_tokens_direct(self, text: str) -> List[str]:
         """Split text into fixed-size token chunks using character estimation.
@@ -168,7 +191,8 @@ class FixedSizeChunker(ChunkingStrategy):
         self,
         document: ProcessedDocument,
         chunk_text: str,
-        chunk_index: int
+        chunk_index: int,
+        start_pos: int
     ) -> DocumentChunk:
         """Create a DocumentChunk from text and metadata.
 
@@ -176,12 +200,11 @@ class FixedSizeChunker(ChunkingStrategy):
             document: Source document
             chunk_text: Text content of the chunk
             chunk_index: Index of this chunk in the document
+            start_pos: Offset of the chunk in the cleaned document text
 
         Returns:
             DocumentChunk object
         """
-        # Calculate positions (approximate for character-based splitting)
-        start_pos = chunk_index * self.chunk_size
         end_pos = start_pos + len(chunk_text)
 
         # Estimate token count using character ratio
@@ -199,8 +222,7 @@ class FixedSizeChunker(ChunkingStrategy):
                 'title': document.title,
                 'authors': document.authors,
                 'chunk_index': chunk_index,
-                'total_chunks': 0,  # Will be updated by pipeline
-                'strategy_config': self.get_strategy_config()
+                'total_chunks': 0  # Will be updated by pipeline
             }
         )
 
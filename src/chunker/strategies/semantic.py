@@ -4,16 +4,35 @@ This strategy creates chunks based on semantic similarity, identifying
 natural breakpoints in the document based on meaning rather than structure.
 """
 
-from typing import Dict, List, Any
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import logging
+import re
+import threading
 
 from ..base import ChunkingStrategy, TokenCounter, ChunkingError
+from ..embedding_cache import (
+    CachedEmbeddings, EmbeddingCache, PrefetchedEmbeddings
+)
 from ..models import ProcessedDocument, DocumentChunk
 from ..utils import clean_text
 
 
 logger = logging.getLogger(__name__)
 
+# Simple sentence splitting (could be improved with nltk/spacy)
+_SENT_SPLIT_RE = re.compile(r'[.!?]+\s+')
+
+# Supported embedding precisions mapped to torch dtype names
+_PRECISION_DTYPES = {
+    'fp32': 'float32',
+    'fp16': 'float16',
+    'bf16': 'bfloat16'
+}
+
+_BACKENDS = ('torch', 'onnx')
+
 
 class SemanticChunker(ChunkingStrategy):
     """Semantic chunking strategy based on sentence similarity.
@@ -22,6 +41,12 @@ class SemanticChunker(ChunkingStrategy):
     identify natural breakpoints for chunking.
     """
 
+    # Loaded models are shared by every instance using the same model name,
+    # precision and backend
+    _MODEL_CACHE: ClassVar[Dict[Tuple[str, str, str], Any]] = {}
+    _EMBEDDINGS_CACHE: ClassVar[Dict[Tuple[str, str, str], Any]] = {}
+    _MODEL_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the semantic chunker.
 
@@ -33,6 +58,17 @@ class SemanticChunker(ChunkingStrategy):
                 - min_chunk_size: Minimum chunk size in chars (default: 200)
                 - max_chunk_size: Maximum chunk size in chars (default: 2000)
                 - batch_size: Batch size for embeddings (default: 32)
+                - precision: Model weight precision, one of 'auto',
+                  'fp32', 'fp16' or 'bf16' (default: 'auto', which uses
+                  fp16 on CUDA and fp32 on CPU)
+                - backend: Inference backend, 'torch' or 'onnx'
+                  (default: 'torch'). 'onnx' runs the model with ONNX
+                  Runtime on CPU and requires optimum[onnxruntime]
+                - embedding_cache_path: SQLite file for persisting
+                  sentence embeddings across runs (default: None,
+                  caching disabled). DEFAULT_CHUNKING_CONFIG, used by
+                  the chunking pipeline, enables it at
+                  data/cache/semantic_embeddings.db
         """
         super().__init__(config)
         # Override base class inference
@@ -46,6 +82,8 @@ class SemanticChunker(ChunkingStrategy):
         self.min_chunk_size = config.get('min_chunk_size', 200)
         self.max_chunk_size = config.get('max_chunk_size', 2000)
         self.batch_size = config.get('batch_size', 32)
+        self.precision = config.get('precision', 'auto')
+        self.backend = config.get('backend', 'torch')
 
         # Initialize token counter
         self.token_counter = TokenCounter()
@@ -53,6 +91,15 @@ class SemanticChunker(ChunkingStrategy):
         # Initialize embedding model (lazy loading)
         self._embedder = None
 
+        # Sentence embeddings precomputed by chunk_documents
+        self._prefetched: Optional[Dict[str, List[float]]] = None
+
+        # Optional persistent embedding cache
+        cache_path = config.get('embedding_cache_path')
+        self._embedding_cache = (
+            EmbeddingCache(cache_path) if cache_path else None
+        )
+
         # Validate configuration
         if self.similarity_threshold < 0 or self.similarity_threshold > 1:
             raise ValueError("similarity_threshold must be between 0 and 1")
@@ -65,14 +112,81 @@ class SemanticChunker(ChunkingStrategy):
                 "max_chunk_size must be greater than min_chunk_size"
             )
 
+        if self.precision != 'auto' and self.precision not in (
+                _PRECISION_DTYPES):
+            raise ValueError(
+                "precision must be one of 'auto', "
+                + ", ".join(f"'{name}'" for name in _PRECISION_DTYPES)
+            )
+
+        if self.backend not in _BACKENDS:
+            raise ValueError("backend must be 'torch' or 'onnx'")
+
+    @property
+    def _model_key(self) -> Tuple[str, str, str]:
+        """Key identifying a loaded model in the class-level caches."""
+        return (self.embedding_model, self.precision, self.backend)
+
+    def _model_kwargs(self) -> Dict[str, Any]:
+        """Build SentenceTransformer kwargs for the configured backend.
+
+        Half precision roughly halves inference time and activation memory
+        on GPU without affecting the similarity breakpoints. The ONNX
+        backend targets CPU-only nodes, where ONNX Runtime's fused kernels
+        are several times faster than eager PyTorch.
+
+        Returns:
+            Keyword arguments with device and backend options, or an empty
+            dict when torch is not available
+        """
+        if self.backend == 'onnx':
+            return {
+                'backend': 'onnx',
+                'device': 'cpu',
+                'model_kwargs': {'provider': 'CPUExecutionProvider'}
+            }
+
+        try:
+            import torch
+        except ImportError:
+            return {}
+
+        device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        precision = self.precision
+        if precision == 'auto':
+            precision = 'fp16' if device == 'cuda' else 'fp32'
+
+        return {
+            'device': device,
+            'model_kwargs': {
+                'torch_dtype': getattr(torch, _PRECISION_DTYPES[precision])
+            }
+        }
+
     @property
     def embedder(self):
-        """Lazy loading of the sentence transformer model."""
+        """Lazy loading of the sentence transformer model.
+
+        Models are cached at class level keyed by model name, so all
+        chunkers configured with the same model share one set of weights.
+        """
         if self._embedder is None:
             try:
                 from sentence_transformers import SentenceTransformer
-                self._embedder = SentenceTransformer(self.embedding_model)
-                logger.info(f"Loaded embedding model: {self.embedding_model}")
+                with SemanticChunker._MODEL_LOCK:
+                    model = SemanticChunker._MODEL_CACHE.get(
+                        self._model_key
+                    )
+                    if model is None:
+                        model = SentenceTransformer(
+                            self.embedding_model, **self._model_kwargs()
+                        )
+                        SemanticChunker._MODEL_CACHE[self._model_key] = model
+                        logger.info(
+                            f"Loaded embedding model: {self.embedding_model} "
+                            f"({self.backend} backend)"
+                        )
+                self._embedder = model
             except ImportError as exc:
                 logger.error(
                     "sentence-transformers library is not available. "
@@ -126,13 +240,24 @@ class SemanticChunker(ChunkingStrategy):
             # Try semantic chunking with LangChain's SemanticChunker
             chunks = self._semantic_split_text(text, document.document_id)
 
-            # Create DocumentChunk objects
+            # Create DocumentChunk objects, tracking a monotonic search
+            # cursor so each position lookup scans forward only
             document_chunks = []
+            search_cursor = 0
+            token_counts = self.token_counter.count_tokens_batch(chunks)
+            create_chunk = self._create_document_chunk
             for i, chunk_text in enumerate(chunks):
-                chunk = self._create_document_chunk(
-                    document, chunk_text, i, text
+                chunk = create_chunk(
+                    document, chunk_text, i, text, search_cursor,
+                    token_counts[i]
                 )
                 document_chunks.append(chunk)
+                # Chunks don't overlap, but merged/re-split chunks can
+                # differ in length from the source span, so only advance
+                # half a chunk to avoid skipping past the next one
+                search_cursor = chunk.start_position + max(
+                    1, len(chunk_text) // 2
+                )
 
             logger.info(
                 f"Created {len(document_chunks)} chunks for document "
@@ -149,6 +274,91 @@ class SemanticChunker(ChunkingStrategy):
                 document_id=document.document_id
             )
 
+    def chunk_documents(
+        self, documents: List[ProcessedDocument]
+    ) -> List[List[DocumentChunk]]:
+        """Chunk several documents, embedding all their sentences at once.
+
+        The sentences of every document are embedded in a single batched
+        call, which keeps the model busy instead of dispatching one small
+        batch per document.
+
+        Args:
+            documents: Documents to chunk
+
+        Returns:
+            List of chunk lists, aligned with documents
+
+        Raises:
+            ChunkingError: If chunking any document fails
+        """
+        self._prefetch_embeddings(documents)
+        try:
+            return [self.chunk_document(document) for document in documents]
+        finally:
+            self._prefetched = None
+
+    def _prefetch_embeddings(
+        self, documents: List[ProcessedDocument]
+    ) -> None:
+        """Embed the splitter inputs of all documents in one call.
+
+        Args:
+            documents: Documents whose sentences should be embedded
+        """
+        try:
+            from langchain_experimental.text_splitter import (
+                combine_sentences
+            )
+            embeddings = self._build_embeddings()
+        except ImportError:
+            # chunk_document reports missing dependencies per document
+            return
+
+        splitter = self._make_splitter(embeddings)
+        texts = {}
+        for document in documents:
+            text = clean_text(document.full_text)
+            if not text:
+                continue
+            sentences = re.split(splitter.sentence_split_regex, text)
+            combined = combine_sentences(
+                [{'sentence': sentence} for sentence in sentences],
+                splitter.buffer_size
+            )
+            texts.update(
+                dict.fromkeys(item['combined_sentence'] for item in combined)
+            )
+
+        if texts:
+            texts = list(texts)
+            self._prefetched = dict(
+                zip(texts, embeddings.embed_documents(texts))
+            )
+            logger.info(
+                f"Prefetched {len(texts)} sentence embeddings for "
+                f"{len(documents)} documents"
+            )
+
+    def _build_embeddings(self):
+        """Get the embeddings used by the splitter, with caching applied."""
+        embeddings = self._get_langchain_embeddings()
+        if self._embedding_cache is not None:
+            embeddings = CachedEmbeddings(
+                embeddings, self._embedding_cache, self.embedding_model
+            )
+        return embeddings
+
+    def _make_splitter(self, embeddings):
+        """Create a LangChain SemanticChunker for the given embeddings."""
+        from langchain_experimental.text_splitter import SemanticChunker
+
+        return SemanticChunker(
+            embeddings=embeddings,
+            breakpoint_threshold_type="percentile",
+            breakpoint_threshold_amount=self.similarity_threshold * 100
+        )
+
     def _semantic_split_text(self, text: str, document_id: str) -> List[str]:
         """Split text using semantic analysis.
 
@@ -161,31 +371,43 @@ class SemanticChunker(ChunkingStrategy):
         """
         try:
             # Try to use LangChain's SemanticChunker
-            from langchain_experimental.text_splitter import SemanticChunker
+            embeddings = self._build_embeddings()
+            if self._prefetched is not None:
+                embeddings = PrefetchedEmbeddings(
+                    embeddings, self._prefetched
+                )
 
-            splitter = SemanticChunker(
-                embeddings=self._get_langchain_embeddings(),
-                breakpoint_threshold_type="percentile",
-                breakpoint_threshold_amount=self.similarity_threshold * 100
-            )
+            splitter = self._make_splitter(embeddings)
 
             chunks = splitter.split_text(text)
 
-            # Filter chunks by size constraints
+            # Filter chunks by size constraints. The last chunk is kept as
+            # a list of parts so merging small chunks into it doesn't
+            # re-copy the accumulated string on every merge.
             filtered_chunks = []
+            last_parts = []
+            min_chunk_size = self.min_chunk_size
+            max_chunk_size = self.max_chunk_size
             for chunk in chunks:
-                if len(chunk) < self.min_chunk_size:
+                chunk_size = len(chunk)
+                if chunk_size < min_chunk_size:
                     # Merge small chunks with previous if possible
-                    if filtered_chunks:
-                        filtered_chunks[-1] += "\n\n" + chunk
-                    else:
-                        filtered_chunks.append(chunk)
-                elif len(chunk) > self.max_chunk_size:
+                    last_parts.append(chunk)
+                elif chunk_size > max_chunk_size:
                     # Split large chunks
                     sub_chunks = self._split_large_chunk(chunk)
-                    filtered_chunks.extend(sub_chunks)
+                    if sub_chunks:
+                        if last_parts:
+                            filtered_chunks.append("\n\n".join(last_parts))
+                        filtered_chunks.extend(sub_chunks[:-1])
+                        last_parts = [sub_chunks[-1]]
                 else:
-                    filtered_chunks.append(chunk)
+                    if last_parts:
+                        filtered_chunks.append("\n\n".join(last_parts))
+                    last_parts = [chunk]
+
+            if last_parts:
+                filtered_chunks.append("\n\n".join(last_parts))
 
             return [chunk for chunk in filtered_chunks if chunk.strip()]
 
@@ -204,11 +426,30 @@ class SemanticChunker(ChunkingStrategy):
             ) from exc
 
     def _get_langchain_embeddings(self):
-        """Get LangChain-compatible embeddings wrapper."""
+        """Get LangChain-compatible embeddings wrapper.
+
+        The wrapper is cached at class level keyed by model name.
+        """
+        with SemanticChunker._MODEL_LOCK:
+            embeddings = SemanticChunker._EMBEDDINGS_CACHE.get(
+                self._model_key
+            )
+            if embeddings is None:
+                embeddings = self._load_langchain_embeddings()
+                SemanticChunker._EMBEDDINGS_CACHE[self._model_key] = (
+                    embeddings
+                )
+        return embeddings
+
+    def _load_langchain_embeddings(self):
+        """Load a LangChain-compatible embeddings wrapper."""
         try:
             # Try the new langchain-huggingface import first
             from langchain_huggingface import HuggingFaceEmbeddings
-            return HuggingFaceEmbeddings(model_name=self.embedding_model)
+            return HuggingFaceEmbeddings(
+                model_name=self.embedding_model,
+                model_kwargs=self._model_kwargs()
+            )
         except ImportError:
             try:
                 # Fallback to community embeddings
@@ -216,7 +457,8 @@ class SemanticChunker(ChunkingStrategy):
                     SentenceTransformerEmbeddings
                 )
                 return SentenceTransformerEmbeddings(
-                    model_name=self.embedding_model
+                    model_name=self.embedding_model,
+                    model_kwargs=self._model_kwargs()
                 )
             except ImportError:
                 logger.warning("LangChain embeddings not available")
@@ -231,43 +473,35 @@ class SemanticChunker(ChunkingStrategy):
         Returns:
             List of sentences
         """
-        import re
-
-        # Simple sentence splitting (could be improved with nltk/spacy)
-        sentences = re.split(r'[.!?]+\s+', text)
+        sentences = _SENT_SPLIT_RE.split(text)
         return [sent.strip() for sent in sentences if sent.strip()]
 
     def _split_by_sentence_size(self, sentences: List[str]) -> List[str]:
         """Split sentences into chunks based on size constraints.
 
+        Chunk boundaries are found by bisecting a prefix sum of sentence
+        lengths, so each chunk is built with a single join.
+
         Args:
             sentences: List of sentences
 
         Returns:
             List of chunks
         """
-        chunks = []
-        current_chunk = []
-        current_size = 0
-
-        for sentence in sentences:
-            sentence_size = len(sentence)
+        cumulative = list(accumulate(len(sentence) for sentence in sentences))
 
-            if (current_size + sentence_size > self.max_chunk_size and
-                    current_chunk):
-
-                chunk_text = ' '.join(current_chunk)
-                chunks.append(chunk_text)
-                current_chunk = [sentence]
-                current_size = sentence_size
-            else:
-                current_chunk.append(sentence)
-                current_size += sentence_size
-
-        # Add final chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
-            chunks.append(chunk_text)
+        chunks = []
+        start = 0
+        start_size = 0
+        while start < len(sentences):
+            end = bisect_right(
+                cumulative, start_size + self.max_chunk_size, lo=start
+            )
+            # Always take at least one sentence, even if it is oversized
+            end = max(end, start + 1)
+            chunks.append(' '.join(sentences[start:end]))
+            start = end
+            start_size = cumulative[end - 1]
 
         return chunks
 
@@ -288,7 +522,9 @@ class SemanticChunker(ChunkingStrategy):
         document: ProcessedDocument,
         chunk_text: str,
         chunk_index: int,
-        original_text: str
+        original_text: str,
+        search_from: int = 0,
+        token_count: Optional[int] = None
     ) -> DocumentChunk:
         """Create a DocumentChunk from text and metadata.
 
@@ -297,19 +533,25 @@ class SemanticChunker(ChunkingStrategy):
             chunk_text: Text content of the chunk
             chunk_index: Index of this chunk in the document
             original_text: Original document text for position calculation
+            search_from: Offset in original_text where the search for this
+                chunk starts (chunks appear in document order)
+            token_count: Precomputed token count, counted here if omitted
 
         Returns:
             DocumentChunk object
         """
-        # Find approximate position in original text
-        start_pos = original_text.find(chunk_text[:100])
+        # Find position in original text, scanning forward from the end of
+        # the previous chunk
+        search_from = min(search_from, len(original_text))
+        start_pos = original_text.find(chunk_text[:100], search_from)
         if start_pos == -1:
-            start_pos = chunk_index * 1000  # Rough estimate
+            start_pos = search_from  # Best estimate
 
         end_pos = start_pos + len(chunk_text)
 
-        # Count tokens in the chunk
-        token_count = self.token_counter.count_tokens(chunk_text)
+        # Count tokens in the chunk unless already counted in batch
+        if token_count is None:
+            token_count = self.token_counter.count_tokens(chunk_text)
 
         return DocumentChunk(
             chunk_id=self.generate_chunk_id(document.document_id, chunk_index),
@@ -326,8 +568,7 @@ class SemanticChunker(ChunkingStrategy):
                 'total_chunks': 0,  # Will be updated by pipeline
                 'chunk_size': len(chunk_text),  # Actual size of this chunk
                 'embedding_model': self.embedding_model,
-                'similarity_threshold': self.similarity_threshold,
-                'strategy_config': self.get_strategy_config()
+                'similarity_threshold': self.similarity_threshold
             }
         )
 
@@ -343,5 +584,7 @@ class SemanticChunker(ChunkingStrategy):
             'similarity_threshold': self.similarity_threshold,
             'min_chunk_size': self.min_chunk_size,
             'max_chunk_size': self.max_chunk_size,
-            'batch_size': self.batch_size
+            'batch_size': self.batch_size,
+            'precision': self.precision,
+            'backend': self.backend
         }
@@ -4,7 +4,7 @@ This strategy uses LangChain's RecursiveCharacterTextSplitter to create
 overlapping chunks with document structure awareness.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
 
 from ..base import ChunkingStrategy, TokenCounter, ChunkingError
@@ -48,6 +48,9 @@ class SlidingLangChainChunker(ChunkingStrategy):
         # Initialize token counter for metadata
         self.token_counter = TokenCounter()
 
+        # Text splitter (lazy loading, reused across documents)
+        self._splitter = None
+
         # Validate configuration
         if self.chunk_size <= 0:
             raise ValueError("chunk_size must be positive")
@@ -92,13 +95,20 @@ class SlidingLangChainChunker(ChunkingStrategy):
             # Split text using LangChain's RecursiveCharacterTextSplitter
             chunks = self._split_text_recursively(text, document.document_id)
 
-            # Create DocumentChunk objects
+            # Create DocumentChunk objects, tracking a monotonic search
+            # cursor so each position lookup scans forward only
             document_chunks = []
+            search_cursor = 0
+            token_counts = self.token_counter.count_tokens_batch(chunks)
             for i, chunk_text in enumerate(chunks):
                 chunk = self._create_document_chunk(
-                    document, chunk_text, i, text
+                    document, chunk_text, i, text, search_cursor,
+                    token_counts[i]
                 )
                 document_chunks.append(chunk)
+                search_cursor = chunk.start_position + max(
+                    1, len(chunk_text) - self.chunk_overlap
+                )
 
             logger.info(
                 f"Created {len(document_chunks)} chunks for document "
@@ -129,18 +139,21 @@ class SlidingLangChainChunker(ChunkingStrategy):
         """
         try:
             # Try to use LangChain's RecursiveCharacterTextSplitter
-            from langchain_text_splitters import RecursiveCharacterTextSplitter
-
-            splitter = RecursiveCharacterTextSplitter(
-                chunk_size=self.chunk_size,
-                chunk_overlap=self.chunk_overlap,
-                separators=self.separators,
-                keep_separator=self.keep_separator,
-                is_separator_regex=self.is_separator_regex,
-                length_function=len
-            )
+            if self._splitter is None:
+                from langchain_text_splitters import (
+                    RecursiveCharacterTextSplitter
+                )
+
+                self._splitter = RecursiveCharacterTextSplitter(
+                    chunk_size=self.chunk_size,
+                    chunk_overlap=self.chunk_overlap,
+                    separators=self.separators,
+                    keep_separator=self.keep_separator,
+                    is_separator_regex=self.is_separator_regex,
+                    length_function=len
+                )
 
-            return splitter.split_text(text)
+            return self._splitter.split_text(text)
 
         except ImportError as exc:
             logger.error(
@@ -159,7 +172,9 @@ class SlidingLangChainChunker(ChunkingStrategy):
         document: ProcessedDocument,
         chunk_text: str,
         chunk_index: int,
-        original_text: str
+        original_text: str,
+        search_from: int = 0,
+        token_count: Optional[int] = None
     ) -> DocumentChunk:
         """Create a DocumentChunk from text and metadata.
 
@@ -168,21 +183,25 @@ class SlidingLangChainChunker(ChunkingStrategy):
             chunk_text: Text content of the chunk
             chunk_index: Index of this chunk in the document
             original_text: Original document text for position calculation
+            search_from: Offset in original_text where the search for this
+                chunk starts (chunks appear in document order)
+            token_count: Precomputed token count, counted here if omitted
 
         Returns:
             DocumentChunk object
         """
-        # Find actual start position in original text
-        start_pos = 0
-        if chunk_index > 0:
-            # This is an approximation - LangChain doesn't provide exact
-            # positions
-            start_pos = chunk_index * (self.chunk_size - self.chunk_overlap)
+        # Find position in original text, scanning forward from the end of
+        # the previous chunk
+        search_from = min(search_from, len(original_text))
+        start_pos = original_text.find(chunk_text[:100], search_from)
+        if start_pos == -1:
+            start_pos = search_from  # Best estimate
 
         end_pos = start_pos + len(chunk_text)
 
-        # Count tokens in the chunk
-        token_count = self.token_counter.count_tokens(chunk_text)
+        # Count tokens in the chunk unless already counted in batch
+        if token_count is None:
+            token_count = self.token_counter.count_tokens(chunk_text)
 
         return DocumentChunk(
             chunk_id=self.generate_chunk_id(document.document_id, chunk_index),
@@ -198,8 +217,7 @@ class SlidingLangChainChunker(ChunkingStrategy):
                 'chunk_index': chunk_index,
                 'total_chunks': 0,  # Will be updated by pipeline
                 'overlap_size': self.chunk_overlap,
-                'separators_used': self.separators,
-                'strategy_config': self.get_strategy_config()
+                'separators_used': self.separators
             }
         )
 
@@ -4,20 +4,38 @@ This strategy creates chunks based on document elements from Unstructured,
 with custom overlap implementation that respects element boundaries.
 """
 
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 import logging
+import os
 
 from ..base import ChunkingStrategy, TokenCounter, ChunkingError
 from ..models import ProcessedDocument, DocumentChunk
 from ..utils import (
-    calculate_overlap_positions,
+    ElementColumns,
     group_elements_by_priority,
-    extract_text_from_elements
+    iter_overlap_positions,
+    join_element_texts
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Chunker rebuilt from config in each chunk_documents worker process
+_worker_chunker = None
+
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    """Create the per-process chunker used by chunk_documents."""
+    global _worker_chunker
+    _worker_chunker = SlidingUnstructuredChunker(config)
+
+
+def _chunk_in_worker(document: ProcessedDocument) -> List[DocumentChunk]:
+    """Chunk a document with the per-process chunker."""
+    return _worker_chunker.chunk_document(document)
+
 
 class SlidingUnstructuredChunker(ChunkingStrategy):
     """Sliding window chunking using Unstructured document elements.
@@ -37,6 +55,12 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
                   (default: ['Title', 'Header', 'NarrativeText'])
                 - respect_boundaries: Whether to respect element boundaries
                   (default: True)
+                - n_workers: Worker processes used by chunk_documents
+                  (default: None, one per CPU)
+                - per_element_token_counts: Estimate chunk token counts by
+                  summing per-element counts, so elements shared by
+                  overlapping windows are tokenized once (default: False,
+                  exact counts)
         """
         super().__init__(config)
         # Override base class inference
@@ -49,6 +73,11 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
             ['Title', 'Header', 'NarrativeText']
         )
         self.respect_boundaries = config.get('respect_boundaries', True)
+        self._priority_set = frozenset(self.priority_elements)
+        self.n_workers = config.get('n_workers')
+        self.per_element_token_counts = config.get(
+            'per_element_token_counts', False
+        )
 
         # Initialize token counter for metadata
         self.token_counter = TokenCounter()
@@ -60,6 +89,9 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
         if self.overlap_percentage < 0 or self.overlap_percentage >= 1:
             raise ValueError("overlap_percentage must be between 0 and 1")
 
+        if self.n_workers is not None and self.n_workers <= 0:
+            raise ValueError("n_workers must be positive")
+
     def chunk_document(
         self, document: ProcessedDocument
     ) -> List[DocumentChunk]:
@@ -93,7 +125,7 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
             # Group elements by priority if enabled
             if self.respect_boundaries:
                 element_groups = group_elements_by_priority(
-                    document.elements, self.priority_elements
+                    document.elements, self._priority_set
                 )
                 chunks = self._chunk_element_groups(element_groups, document)
             else:
@@ -116,9 +148,41 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
                 document_id=document.document_id
             )
 
+    def chunk_documents(
+        self, documents: List[ProcessedDocument]
+    ) -> List[List[DocumentChunk]]:
+        """Chunk several documents in parallel worker processes.
+
+        Element chunking is pure-Python string work with no shared state,
+        so documents are spread across processes to sidestep the GIL.
+
+        Args:
+            documents: Documents to chunk
+
+        Returns:
+            List of chunk lists, aligned with documents
+
+        Raises:
+            ChunkingError: If chunking any document fails
+        """
+        n_workers = min(self.n_workers or os.cpu_count() or 1, len(documents))
+        if n_workers <= 1:
+            return [self.chunk_document(document) for document in documents]
+
+        # A few tasks per worker balances load without per-document IPC
+        chunksize = max(1, len(documents) // (n_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(self.config,)
+        ) as executor:
+            return list(executor.map(
+                _chunk_in_worker, documents, chunksize=chunksize
+            ))
+
     def _chunk_element_groups(
         self,
-        element_groups: List[List[Dict[str, Any]]],
+        element_groups: Iterable[List[Dict[str, Any]]],
         document: ProcessedDocument
     ) -> List[DocumentChunk]:
         """Chunk elements by respecting groups and boundaries.
@@ -130,38 +194,40 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
         Returns:
             List of document chunks
         """
-        chunks = []
+        pending = []
         chunk_index = 0
 
         for group in element_groups:
             if not group:
                 continue
 
-            # Calculate overlap positions for this group
-            overlap_positions = calculate_overlap_positions(
-                group, self.overlap_percentage
-            )
+            # Read element fields once; overlapping windows reuse them
+            columns = ElementColumns.from_elements(group)
 
-            for start_idx, end_idx in overlap_positions:
+            # Walk overlap positions for this group as they are computed
+            for start_idx, end_idx in iter_overlap_positions(
+                group, self.overlap_percentage, self.max_elements_per_chunk
+            ):
                 elements_subset = group[start_idx:end_idx]
 
                 if not elements_subset:
                     continue
 
                 # Extract text from elements
-                chunk_text = extract_text_from_elements(elements_subset)
+                chunk_text = join_element_texts(
+                    columns.texts[start_idx:end_idx]
+                )
 
-                if not chunk_text.strip():
+                if not chunk_text:
                     continue
 
-                # Create chunk
-                chunk = self._create_document_chunk(
-                    document, chunk_text, elements_subset, chunk_index
-                )
-                chunks.append(chunk)
+                pending.append((
+                    chunk_text, elements_subset, chunk_index,
+                    columns, start_idx, end_idx
+                ))
                 chunk_index += 1
 
-        return chunks
+        return self._create_document_chunks(document, pending)
 
     def _chunk_elements_directly(
         self,
@@ -177,13 +243,15 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
         Returns:
             List of document chunks
         """
-        chunks = []
+        pending = []
 
-        # Calculate overlap positions for all elements
-        overlap_positions = calculate_overlap_positions(
-            elements, self.overlap_percentage
-        )
+        # Read element fields once; overlapping windows reuse them
+        columns = ElementColumns.from_elements(elements)
 
+        # Walk overlap positions for all elements as they are computed
+        overlap_positions = iter_overlap_positions(
+            elements, self.overlap_percentage, self.max_elements_per_chunk
+        )
         for chunk_index, (start_idx, end_idx) in enumerate(overlap_positions):
             elements_subset = elements[start_idx:end_idx]
 
@@ -191,18 +259,101 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
                 continue
 
             # Extract text from elements
-            chunk_text = extract_text_from_elements(elements_subset)
+            chunk_text = join_element_texts(columns.texts[start_idx:end_idx])
 
-            if not chunk_text.strip():
+            if not chunk_text:
                 continue
 
-            # Create chunk
-            chunk = self._create_document_chunk(
-                document, chunk_text, elements_subset, chunk_index
+            pending.append((
+                chunk_text, elements_subset, chunk_index,
+                columns, start_idx, end_idx
+            ))
+
+        return self._create_document_chunks(document, pending)
+
+    def _create_document_chunks(
+        self,
+        document: ProcessedDocument,
+        pending: List[
+            Tuple[str, List[Dict[str, Any]], int, ElementColumns, int, int]
+        ]
+    ) -> List[DocumentChunk]:
+        """Create DocumentChunks, counting all their tokens in one batch.
+
+        Args:
+            document: Source document
+            pending: (chunk_text, elements, chunk_index, columns, start_idx,
+                end_idx) for each chunk, where columns hold the fields of
+                the elements the window was sliced from
+
+        Returns:
+            List of document chunks
+        """
+        if self.per_element_token_counts:
+            token_counts = self._estimate_token_counts(pending)
+        else:
+            token_counts = self.token_counter.count_tokens_batch(
+                [item[0] for item in pending]
+            )
+        return [
+            self._create_document_chunk(
+                document, chunk_text, elements, chunk_index, token_count,
+                element_types=columns.types[start_idx:end_idx],
+                element_pages=columns.pages[start_idx:end_idx]
             )
-            chunks.append(chunk)
+            for (
+                chunk_text, elements, chunk_index, columns, start_idx, end_idx
+            ), token_count in zip(pending, token_counts)
+        ]
 
-        return chunks
+    def _estimate_token_counts(
+        self,
+        pending: List[
+            Tuple[str, List[Dict[str, Any]], int, ElementColumns, int, int]
+        ]
+    ) -> List[int]:
+        """Estimate chunk token counts from per-element token counts.
+
+        Each element is tokenized once and every window sums a range of a
+        prefix sum, adding one token per paragraph separator. Tokens that
+        BPE would merge across element boundaries make this an estimate.
+
+        Args:
+            pending: Chunks as passed to _create_document_chunks
+
+        Returns:
+            Estimated token count per chunk
+        """
+        # Distinct column sets, in order of first use
+        columns_by_id = {}
+        for item in pending:
+            columns_by_id.setdefault(id(item[3]), item[3])
+
+        element_counts = iter(self.token_counter.count_tokens_batch([
+            text for columns in columns_by_id.values()
+            for text in columns.texts
+        ]))
+
+        prefixes = {}
+        for key, columns in columns_by_id.items():
+            counts = [next(element_counts) for _ in columns.texts]
+            prefixes[key] = (
+                list(accumulate(counts, initial=0)),
+                # Non-empty texts, which are the ones joined into the chunk
+                list(accumulate((1 if t else 0 for t in columns.texts),
+                                initial=0))
+            )
+
+        token_counts = []
+        for _, _, _, columns, start_idx, end_idx in pending:
+            token_prefix, text_prefix = prefixes[id(columns)]
+            separators = max(
+                0, text_prefix[end_idx] - text_prefix[start_idx] - 1
+            )
+            token_counts.append(
+                token_prefix[end_idx] - token_prefix[start_idx] + separators
+            )
+        return token_counts
 
     def _fallback_text_chunking(
         self, document: ProcessedDocument
@@ -231,7 +382,10 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
         document: ProcessedDocument,
         chunk_text: str,
         elements: List[Dict[str, Any]],
-        chunk_index: int
+        chunk_index: int,
+        token_count: Optional[int] = None,
+        element_types: Optional[List[str]] = None,
+        element_pages: Optional[List[Any]] = None
     ) -> DocumentChunk:
         """Create a DocumentChunk from elements and metadata.
 
@@ -240,6 +394,11 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
             chunk_text: Text content of the chunk
             elements: List of elements in this chunk
             chunk_index: Index of this chunk in the document
+            token_count: Precomputed token count, counted here if omitted
+            element_types: Precomputed element types, read from elements
+                if omitted
+            element_pages: Precomputed element page numbers, read from
+                elements if omitted
 
         Returns:
             DocumentChunk object
@@ -257,12 +416,17 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
             start_pos = first_element.get('start_position', 0)
             end_pos = last_element.get('end_position', len(chunk_text))
 
-        # Count tokens in the chunk
-        token_count = self.token_counter.count_tokens(chunk_text)
+        # Count tokens in the chunk unless already counted in batch
+        if token_count is None:
+            token_count = self.token_counter.count_tokens(chunk_text)
 
-        # Extract element metadata
-        element_types = [elem.get('type', 'Unknown') for elem in elements]
-        element_pages = [elem.get('page_number', 1) for elem in elements]
+        # Extract element metadata unless already read from columns
+        if element_types is None:
+            element_types = [elem.get('type', 'Unknown') for elem in elements]
+        if element_pages is None:
+            element_pages = [elem.get('page_number', 1) for elem in elements]
+        # Distinct pages in document order
+        page_numbers = list(dict.fromkeys(element_pages))
 
         return DocumentChunk(
             chunk_id=self.generate_chunk_id(document.document_id, chunk_index),
@@ -279,9 +443,8 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
                 'total_chunks': 0,  # Will be updated by pipeline
                 'element_count': len(elements),
                 'element_types': element_types,
-                'page_numbers': list(set(element_pages)),
-                'overlap_percentage': self.overlap_percentage,
-                'strategy_config': self.get_strategy_config()
+                'page_numbers': page_numbers,
+                'overlap_percentage': self.overlap_percentage
             },
             elements=elements
         )
@@ -297,5 +460,7 @@ class SlidingUnstructuredChunker(ChunkingStrategy):
             'max_elements_per_chunk': self.max_elements_per_chunk,
             'overlap_percentage': self.overlap_percentage,
             'priority_elements': self.priority_elements,
-            'respect_boundaries': self.respect_boundaries
+            'respect_boundaries': self.respect_boundaries,
+            'n_workers': self.n_workers,
+            'per_element_token_counts': self.per_element_token_counts
         }
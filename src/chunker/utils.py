@@ -4,8 +4,10 @@ This module provides common utilities used across different chunking
 strategies, including overlap logic, text processing, and metrics calculation.
 """
 
+import math
 import re
-from typing import List, Dict, Any, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 import logging
 
 from .models import DocumentChunk
@@ -13,65 +15,93 @@ from .models import DocumentChunk
 
 logger = logging.getLogger(__name__)
 
+_DOTS_RE = re.compile(r'\.{4,}')
+_DASHES_RE = re.compile(r'-{3,}')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_SENTENCE_BOUNDARY_RE = re.compile(r'[.!?]+\s+')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\n+')
+
+# Number of leading words inspected by the repetition check
+_REPETITION_SAMPLE_SIZE = 256
+
+
+def iter_overlap_positions(
+    elements: List[Dict[str, Any]],
+    overlap_percentage: float = 0.2,
+    max_elements: int = 10
+) -> Iterator[Tuple[int, int]]:
+    """Yield overlap positions for element-based chunking.
+    
+    Args:
+        elements: List of document elements with position information
+        overlap_percentage: Percentage of overlap between chunks
+        max_elements: Maximum number of elements per chunk
+        
+    Yields:
+        (start_idx, end_idx) tuples for each chunk
+    """
+    if not elements or overlap_percentage <= 0:
+        yield (0, len(elements))
+        return
+    
+    total = len(elements)
+    
+    # Every chunk but the last is full, so the overlap is constant and the
+    # start positions form an arithmetic progression. Single-element
+    # chunks cannot overlap, so always advance by at least one element.
+    overlap_elements = max(1, int(max_elements * overlap_percentage))
+    stride = max(1, max_elements - overlap_elements)
+    
+    # Stop after the first chunk that reaches the end of the elements
+    for start in range(0, max(1, total - max_elements + stride), stride):
+        yield (start, min(start + max_elements, total))
+
 
 def calculate_overlap_positions(
     elements: List[Dict[str, Any]],
-    overlap_percentage: float = 0.2
+    overlap_percentage: float = 0.2,
+    max_elements: int = 10
 ) -> List[Tuple[int, int]]:
     """Calculate overlap positions for element-based chunking.
     
     Args:
         elements: List of document elements with position information
         overlap_percentage: Percentage of overlap between chunks
+        max_elements: Maximum number of elements per chunk
         
     Returns:
         List of (start_idx, end_idx) tuples for each chunk
     """
-    if not elements or overlap_percentage <= 0:
-        return [(0, len(elements))]
-    
-    chunks = []
-    current_start = 0
-    
-    while current_start < len(elements):
-        # Calculate chunk end position
-        chunk_end = min(current_start + 10, len(elements))  # Max 10 elements
-        
-        # Add current chunk
-        chunks.append((current_start, chunk_end))
-        
-        # Calculate next start position with overlap
-        if chunk_end >= len(elements):
-            break
-            
-        overlap_elements = max(
-            1, int((chunk_end - current_start) * overlap_percentage)
-        )
-        current_start = chunk_end - overlap_elements
-    
-    return chunks
+    return list(
+        iter_overlap_positions(elements, overlap_percentage, max_elements)
+    )
 
 
 def group_elements_by_priority(
     elements: List[Dict[str, Any]],
-    priority_elements: List[str] = None
-) -> List[List[Dict[str, Any]]]:
+    priority_elements: Iterable[str] = None
+) -> Iterator[List[Dict[str, Any]]]:
     """Group elements by priority for better chunking.
     
+    Groups are yielded as they are completed, so callers that consume
+    them one at a time never hold the full grouping in memory.
+    
     Args:
         elements: List of document elements
-        priority_elements: List of element types to prioritize
+        priority_elements: Element types to prioritize
         
-    Returns:
-        List of element groups
+    Yields:
+        Element groups, in document order
     """
     if not elements:
-        return []
+        return
     
     if not priority_elements:
         priority_elements = ["Title", "Header", "NarrativeText"]
     
-    groups = []
+    # Hash-based membership for the per-element type check
+    priority_set = frozenset(priority_elements)
+    
     current_group = []
     
     for element in elements:
@@ -79,20 +109,18 @@ def group_elements_by_priority(
         
         # Start new group if we hit a high-priority element
         # and current group isn't empty
-        if (element_type in priority_elements and
+        if (element_type in priority_set and
                 current_group and
                 len(current_group) > 0):
             
-            groups.append(current_group)
+            yield current_group
             current_group = [element]
         else:
             current_group.append(element)
     
     # Add the last group if it's not empty
     if current_group:
-        groups.append(current_group)
-    
-    return groups
+        yield current_group
 
 
 def clean_text(text: str) -> str:
@@ -107,19 +135,67 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove leading/trailing whitespace
-    text = text.strip()
+    # Remove excessive and leading/trailing whitespace (str.split splits
+    # on the same characters as \s, without the regex engine)
+    text = ' '.join(text.split())
     
-    # Remove common PDF artifacts
-    text = re.sub(r'\.{3,}', '...', text)  # Multiple dots
-    text = re.sub(r'-{2,}', '--', text)    # Multiple dashes
+    # Remove common PDF artifacts, skipping the regex when absent
+    if '....' in text:
+        text = _DOTS_RE.sub('...', text)  # Multiple dots
+    if '---' in text:
+        text = _DASHES_RE.sub('--', text)  # Multiple dashes
     
     return text
 
 
+@dataclass
+class ElementColumns:
+    """Element fields extracted once into parallel lists.
+    
+    Overlapping chunk windows slice these columns instead of repeating
+    per-element dict lookups for every window an element falls into.
+    """
+    
+    texts: List[str]
+    types: List[str]
+    pages: List[Any]
+    
+    @classmethod
+    def from_elements(
+        cls, elements: List[Dict[str, Any]]
+    ) -> 'ElementColumns':
+        """Build columns from a list of element dicts."""
+        return cls(
+            texts=get_element_texts(elements),
+            types=[element.get('type', 'Unknown') for element in elements],
+            pages=[element.get('page_number', 1) for element in elements]
+        )
+
+
+def get_element_texts(elements: List[Dict[str, Any]]) -> List[str]:
+    """Get the stripped text of each element.
+    
+    Args:
+        elements: List of document elements
+        
+    Returns:
+        Stripped text per element, aligned with elements
+    """
+    return [element.get('text', '').strip() for element in elements]
+
+
+def join_element_texts(texts: List[str]) -> str:
+    """Combine precomputed element texts, skipping empty ones.
+    
+    Args:
+        texts: Stripped element texts, as returned by get_element_texts
+        
+    Returns:
+        Combined text
+    """
+    return '\n\n'.join(text for text in texts if text)
+
+
 def extract_text_from_elements(elements: List[Dict[str, Any]]) -> str:
     """Extract and combine text from document elements.
     
@@ -132,13 +208,7 @@ def extract_text_from_elements(elements: List[Dict[str, Any]]) -> str:
     if not elements:
         return ""
     
-    texts = []
-    for element in elements:
-        text = element.get('text', '').strip()
-        if text:
-            texts.append(text)
-    
-    return '\n\n'.join(texts)
+    return join_element_texts(get_element_texts(elements))
 
 
 def calculate_text_statistics(text: str) -> Dict[str, Any]:
@@ -163,12 +233,12 @@ def calculate_text_statistics(text: str) -> Dict[str, Any]:
     word_count = len(text.split())
     
     # Sentence count (rough estimation)
-    sentence_endings = re.findall(r'[.!?]+', text)
-    sentence_count = len(sentence_endings)
+    sentence_count = sum(1 for _ in _SENTENCE_END_RE.finditer(text))
     
     # Paragraph count
-    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-    paragraph_count = len(paragraphs)
+    paragraph_count = sum(
+        1 for p in text.split('\n\n') if p and not p.isspace()
+    )
     
     return {
         'character_count': character_count,
@@ -181,6 +251,10 @@ def calculate_text_statistics(text: str) -> Dict[str, Any]:
 def validate_chunk_quality(chunk: DocumentChunk) -> Dict[str, Any]:
     """Validate the quality of a generated chunk.
     
+    Word repetition is measured on the first 256 words only, which keeps
+    the check bounded for long chunks; repetition is almost always visible
+    within that window.
+    
     Args:
         chunk: The chunk to validate
         
@@ -207,15 +281,28 @@ def validate_chunk_quality(chunk: DocumentChunk) -> Dict[str, Any]:
     
     # Check for excessive repetition
     words = content.lower().split()
-    if len(words) > 10:
-        unique_words = set(words)
-        repetition_ratio = len(unique_words) / len(words)
-        if repetition_ratio < 0.3:
+    word_count = len(words)
+    if word_count > 10:
+        sample = words[:_REPETITION_SAMPLE_SIZE]
+        sample_size = len(sample)
+        
+        # Stop collecting unique words as soon as there are enough of them
+        # to reach a unique/total ratio of 0.3
+        min_unique = math.floor(sample_size * 0.3)
+        while min_unique / sample_size < 0.3:
+            min_unique += 1
+        
+        unique_words = set()
+        for word in sample:
+            unique_words.add(word)
+            if len(unique_words) >= min_unique:
+                break
+        else:
             issues.append("High word repetition")
             quality_score *= 0.6
     
     # Check token count vs content length consistency
-    estimated_tokens = len(words) * 0.75
+    estimated_tokens = word_count * 0.75
     if abs(chunk.token_count - estimated_tokens) > (estimated_tokens * 0.5):
         issues.append("Token count seems inconsistent")
         quality_score *= 0.9
@@ -224,7 +311,7 @@ def validate_chunk_quality(chunk: DocumentChunk) -> Dict[str, Any]:
         'quality_score': quality_score,
         'issues': issues,
         'character_count': len(content),
-        'word_count': len(words),
+        'word_count': word_count,
         'starts_well': content and content[0].isupper(),
         'ends_well': content and content[-1] in '.!?'
     }
@@ -243,23 +330,19 @@ def find_sentence_boundaries(text: str, max_length: int) -> List[int]:
     if not text or max_length <= 0:
         return []
     
-    # Find sentence endings
-    sentence_endings = []
-    for match in re.finditer(r'[.!?]+\s+', text):
-        sentence_endings.append(match.end())
+    # Find sentence endings; matches come in text order, so the result
+    # is already sorted
+    boundaries = [
+        match.end() for match in _SENTENCE_BOUNDARY_RE.finditer(text)
+    ]
     
-    if not sentence_endings:
+    if not boundaries:
         # Fallback to paragraph breaks
-        for match in re.finditer(r'\n\n+', text):
-            sentence_endings.append(match.end())
-    
-    # Select boundaries that are close to max_length
-    good_boundaries = []
-    for pos in sentence_endings:
-        if pos <= len(text):  # Valid position
-            good_boundaries.append(pos)
+        boundaries = [
+            match.end() for match in _PARAGRAPH_BREAK_RE.finditer(text)
+        ]
     
-    return sorted(good_boundaries)
+    return boundaries
 
 
 def optimize_chunk_boundaries(
@@ -312,6 +395,10 @@ def merge_small_chunks(
 ) -> List[DocumentChunk]:
     """Merge chunks that are too small with adjacent chunks.
     
+    A small chunk keeps absorbing the following chunks of the same document
+    until it reaches min_size, so runs of small chunks are merged in a
+    single pass. Input chunks are not modified.
+    
     Args:
         chunks: List of chunks to potentially merge
         min_size: Minimum chunk size threshold
@@ -323,39 +410,51 @@ def merge_small_chunks(
         return chunks
     
     merged = []
-    i = 0
-    
-    while i < len(chunks):
-        current_chunk = chunks[i]
-        
-        # If chunk is too small and not the last one, try to merge with next
-        if (len(current_chunk.content) < min_size and 
-            i + 1 < len(chunks) and
-            current_chunk.document_id == chunks[i + 1].document_id):
-            
-            next_chunk = chunks[i + 1]
-            
-            # Create merged chunk
-            merged_content = current_chunk.content + "\n\n" + next_chunk.content
-            merged_chunk = DocumentChunk(
-                chunk_id=current_chunk.chunk_id,
-                document_id=current_chunk.document_id,
-                strategy_name=current_chunk.strategy_name,
-                content=merged_content,
-                start_position=current_chunk.start_position,
-                end_position=next_chunk.end_position,
-                token_count=current_chunk.token_count + next_chunk.token_count,
-                metadata={
-                    **current_chunk.metadata,
-                    'merged_from': [current_chunk.chunk_id, next_chunk.chunk_id]
-                },
-                elements=current_chunk.elements + next_chunk.elements
-            )
-            
-            merged.append(merged_chunk)
-            i += 2  # Skip both chunks
+    # Chunks being merged into the current output chunk
+    run = [chunks[0]]
+    run_size = len(chunks[0].content)
+    
+    for chunk in chunks[1:]:
+        if run_size < min_size and chunk.document_id == run[0].document_id:
+            run.append(chunk)
+            run_size += 2 + len(chunk.content)  # Joined with "\n\n"
         else:
-            merged.append(current_chunk)
-            i += 1
+            merged.append(_merge_chunk_run(run))
+            run = [chunk]
+            run_size = len(chunk.content)
     
+    merged.append(_merge_chunk_run(run))
     return merged
+
+
+def _merge_chunk_run(run: List[DocumentChunk]) -> DocumentChunk:
+    """Combine consecutive chunks of one document into a single chunk.
+    
+    Args:
+        run: Chunks to combine, in document order
+        
+    Returns:
+        The only chunk if run has one element, otherwise a new merged chunk
+    """
+    first = run[0]
+    if len(run) == 1:
+        return first
+    
+    elements = []
+    for chunk in run:
+        elements.extend(chunk.elements)
+    
+    return DocumentChunk(
+        chunk_id=first.chunk_id,
+        document_id=first.document_id,
+        strategy_name=first.strategy_name,
+        content="\n\n".join(chunk.content for chunk in run),
+        start_position=first.start_position,
+        end_position=run[-1].end_position,
+        token_count=sum(chunk.token_count for chunk in run),
+        metadata={
+            **first.metadata,
+            'merged_from': [chunk.chunk_id for chunk in run]
+        },
+        elements=elements
+    )
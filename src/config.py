@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # Base paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -26,42 +27,52 @@ TYPESENSE_CONFIG = {
     "api_key": os.getenv("TYPESENSE_API_KEY", "xyz"),
 }
 
-# Chunker strategies configuration
-CHUNKER_STRATEGIES = {
-    "fixed_size": {
+# Chunker strategies configuration (read-only, shared by all importers)
+CHUNKER_STRATEGIES = MappingProxyType({
+    "fixed_size": MappingProxyType({
         "chunk_size": int(os.getenv("CHUNK_SIZE_TOKENS", "1000")),
         "chars_per_token": int(os.getenv("CHUNK_OVERLAP", "4")),
         "collection_name": "chunks_fixed_size"
-    },
-    "sliding_langchain": {
+    }),
+    "sliding_langchain": MappingProxyType({
         "chunk_size": 1000,
         "chunk_overlap": 80,
         "collection_name": "chunks_sliding_langchain"
-    },
-    "sliding_unstructured": {
+    }),
+    "sliding_unstructured": MappingProxyType({
         "chunk_size": 1000,
         "chunk_overlap": 200,
         "collection_name": "chunks_sliding_unstructured"
-    },
-    "semantic": {
+    }),
+    "semantic": MappingProxyType({
         "threshold": float(os.getenv("SEMANTIC_THRESHOLD", "0.8")),
         "collection_name": "chunks_semantic"
-    }
-}
+    })
+})
 
-# Collection schema for Typesense
-COLLECTION_SCHEMA = {
+# Collection schema for Typesense (read-only, fields included; build a
+# collection's schema with dict(COLLECTION_SCHEMA, name=...,
+# fields=[dict(field) for field in COLLECTION_SCHEMA["fields"]]))
+COLLECTION_SCHEMA = MappingProxyType({
     "name": "",  # Will be set dynamically
-    "fields": [
-        {"name": "id", "type": "string"},
-        {"name": "paper_id", "type": "string", "facet": True},
-        {"name": "title", "type": "string", "facet": True},
-        {"name": "authors", "type": "string[]", "facet": True},
-        {"name": "abstract", "type": "string"},
-        {"name": "content", "type": "string"},
-        {"name": "chunk_index", "type": "int32", "facet": True},
-        {"name": "chunk_strategy", "type": "string", "facet": True},
-        {"name": "chunk_size", "type": "int32"},
-        {"name": "created_at", "type": "int64"},
-    ]
-}
+    "fields": (
+        MappingProxyType({"name": "id", "type": "string"}),
+        MappingProxyType(
+            {"name": "paper_id", "type": "string", "facet": True}
+        ),
+        MappingProxyType({"name": "title", "type": "string", "facet": True}),
+        MappingProxyType(
+            {"name": "authors", "type": "string[]", "facet": True}
+        ),
+        MappingProxyType({"name": "abstract", "type": "string"}),
+        MappingProxyType({"name": "content", "type": "string"}),
+        MappingProxyType(
+            {"name": "chunk_index", "type": "int32", "facet": True}
+        ),
+        MappingProxyType(
+            {"name": "chunk_strategy", "type": "string", "facet": True}
+        ),
+        MappingProxyType({"name": "chunk_size", "type": "int32"}),
+        MappingProxyType({"name": "created_at", "type": "int64"}),
+    )
+})
@@ -6,12 +6,14 @@ search queries and categories, as specified in the Demo Implementation Plan.
 
 from .arxiv_downloader import (
     ArxivDownloader,
+    close_shared_session,
     download_papers_by_category,
     download_papers_by_query
 )
 
 __all__ = [
     'ArxivDownloader',
+    'close_shared_session',
     'download_papers_by_category',
     'download_papers_by_query'
 ]
@@ -5,13 +5,24 @@ for the chunking strategies demo system.
 """
 
 import asyncio
-import aiohttp
+import glob
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
 import aiofiles
+import httpx
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import (
+    List, Dict, Optional, Set, Tuple, Union, Any, AsyncIterator
+)
 from dataclasses import dataclass
 import logging
+from itertools import islice
 from urllib.parse import urlencode
 from datetime import datetime
 import re
@@ -33,11 +44,151 @@ from ..config import (
     MAX_CONCURRENT_DOWNLOADS
 )
 
+# Prefer lxml's C parser, fall back to the standard library
+try:
+    from lxml import etree as _etree
+    _XML_PARSE_ERRORS: Tuple[type, ...] = (
+        _etree.XMLSyntaxError, ET.ParseError
+    )
+except ImportError:
+    _etree = ET
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it the
+# client falls back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# orjson serializes paper metadata much faster when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Qualified Atom tag names, matched directly against each child's tag
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_ATOM_ENTRY_TAG = _ATOM + 'entry'
+_TAG_ID = _ATOM + 'id'
+_TAG_TITLE = _ATOM + 'title'
+_TAG_AUTHOR = _ATOM + 'author'
+_TAG_NAME = _ATOM + 'name'
+_TAG_SUMMARY = _ATOM + 'summary'
+_TAG_CATEGORY = _ATOM + 'category'
+_TAG_PUBLISHED = _ATOM + 'published'
+_TAG_LINK = _ATOM + 'link'
+
+# Streaming chunk size for PDF downloads; responses with a known size below
+# the single-write limit are read and written in one go instead
+_DOWNLOAD_CHUNK_BYTES = 256 * 1024
+_SINGLE_WRITE_MAX_BYTES = 4 * 1024 * 1024
+
+# How long search results are reused before ArXiv is queried again
+_SEARCH_CACHE_TTL = 6 * 60 * 60
+
+# Large searches are fetched in pages of this size; ArXiv asks clients to
+# wait a few seconds between consecutive API requests
+_SEARCH_PAGE_SIZE = 100
+_SEARCH_PAGE_DELAY = 3.0
+
+# Paths of papers already downloaded or validated in this process, keyed by
+# download directory and ArXiv ID; least recently used entries are evicted
+_DOWNLOADED_PATHS: 'OrderedDict[Path, Path]' = OrderedDict()
+_DOWNLOADED_PATHS_MAX = 4096
+
+
+def _remember_download(key: Path, path: Path) -> None:
+    """Record where a paper's PDF is, evicting the oldest entry if full."""
+    _DOWNLOADED_PATHS[key] = path
+    _DOWNLOADED_PATHS.move_to_end(key)
+    if len(_DOWNLOADED_PATHS) > _DOWNLOADED_PATHS_MAX:
+        _DOWNLOADED_PATHS.popitem(last=False)
+
+# HTTP client shared by all downloaders on the same event loop, so
+# connections to arxiv.org stay warm between searches and downloads. With
+# HTTP/2, concurrent PDF downloads are multiplexed over one connection.
+_shared_session: Optional[httpx.AsyncClient] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+# Closes the shared client when its event loop shuts down; see
+# _close_at_loop_shutdown
+_shared_session_finalizer: Optional[AsyncIterator[None]] = None
+
+
+async def _close_at_loop_shutdown(
+        client: httpx.AsyncClient) -> AsyncIterator[None]:
+    """Async generator that closes client when its event loop shuts down.
+    
+    Once started, the generator is tracked by the loop, and asyncio.run()
+    (via loop.shutdown_asyncgens) finalizes it before closing the loop,
+    which runs the finally block while the loop can still await.
+    """
+    try:
+        yield
+    finally:
+        if not client.is_closed:
+            await client.aclose()
+
+
+async def _get_shared_session() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it for the running loop.
+    
+    The client is closed when the loop shuts down, so callers that never
+    call close_shared_session don't leak its connections. A client left
+    over from a previous loop has already been closed that way.
+    """
+    global _shared_session, _shared_session_loop, _shared_session_finalizer
+    
+    loop = asyncio.get_running_loop()
+    if (_shared_session is None or _shared_session.is_closed
+            or _shared_session_loop is not loop):
+        limits = httpx.Limits(
+            max_connections=MAX_CONCURRENT_DOWNLOADS,
+            max_keepalive_connections=MAX_CONCURRENT_DOWNLOADS,
+            keepalive_expiry=75
+        )
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=limits,
+            timeout=300,
+            follow_redirects=True
+        )
+        # Assigned before the await below, so concurrent callers on this
+        # loop reuse the client instead of creating another
+        _shared_session = client
+        _shared_session_loop = loop
+        
+        # The loop only holds finalizers weakly, so keep a reference
+        finalizer = _close_at_loop_shutdown(client)
+        _shared_session_finalizer = finalizer
+        await finalizer.__anext__()
+    return _shared_session
+
 
-@dataclass
+async def close_shared_session() -> None:
+    """Close the shared HTTP client.
+    
+    Optional: the client is closed automatically when its event loop shuts
+    down. Call this after the last ArxivDownloader has been used to release
+    the connections earlier.
+    """
+    global _shared_session, _shared_session_loop, _shared_session_finalizer
+    
+    if _shared_session is not None and not _shared_session.is_closed:
+        await _shared_session.aclose()
+    _shared_session = None
+    _shared_session_loop = None
+    _shared_session_finalizer = None
+
+
+@dataclass(slots=True)
 class ArxivPaper:
     """Represents an ArXiv paper with metadata."""
     arxiv_id: str
@@ -48,24 +199,33 @@ class ArxivPaper:
     published: datetime
     pdf_url: str
     entry_id: str
-    summary: str = ""
     
     def __post_init__(self):
         """Clean up the data after initialization."""
         self.title = self._clean_text(self.title)
         self.abstract = self._clean_text(self.abstract)
-        self.authors = [self._clean_text(author) for author in self.authors]
+        self.authors = list(map(self._clean_text, self.authors))
+    
+    @property
+    def summary(self) -> str:
+        """Abstract truncated to 500 characters."""
         if len(self.abstract) > 500:
-            self.summary = self.abstract[:500] + "..."
-        else:
-            self.summary = self.abstract
+            return self.abstract[:500] + "..."
+        return self.abstract
+    
+    @property
+    def display_title(self) -> str:
+        """Title truncated to fit a 50-character table column."""
+        if len(self.title) > 50:
+            return self.title[:47] + "..."
+        return self.title
     
     def _clean_text(self, text: str) -> str:
         """Clean text by removing extra whitespace and newlines."""
         if not text:
             return ""
         # Remove extra whitespace and normalize newlines
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WHITESPACE_RE.sub(' ', text.strip())
         return text
     
     def to_dict(self) -> Dict[str, Any]:
@@ -81,34 +241,142 @@ class ArxivPaper:
             'entry_id': self.entry_id,
             'summary': self.summary
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON with the same fields as to_dict.
+        
+        Uses orjson when available, which encodes the publication date
+        natively instead of going through isoformat().
+        """
+        if orjson is None:
+            return json.dumps(
+                self.to_dict(), ensure_ascii=False, separators=(',', ':')
+            ).encode('utf-8')
+        
+        return orjson.dumps({
+            'arxiv_id': self.arxiv_id,
+            'title': self.title,
+            'authors': self.authors,
+            'abstract': self.abstract,
+            'categories': self.categories,
+            'published': self.published,
+            'pdf_url': self.pdf_url,
+            'entry_id': self.entry_id,
+            'summary': self.summary
+        })
+
+
+class _SearchCache:
+    """SQLite-backed cache of search results keyed by query and paging.
+    
+    Entries older than the TTL are ignored and overwritten on the next
+    successful search.
+    """
+    
+    def __init__(self, path: Path, ttl: float = _SEARCH_CACHE_TTL):
+        """Initialize the cache.
+        
+        Args:
+            path: Location of the SQLite database file
+            ttl: Maximum age of a reusable entry, in seconds
+        """
+        self.path = path
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazily open the database, creating it if needed."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS searches "
+                "(key TEXT PRIMARY KEY, ts INTEGER NOT NULL, "
+                "payload BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+    
+    @staticmethod
+    def make_key(query: str, max_results: int, start: int = 0) -> str:
+        """Build the cache key for a search."""
+        key = f"{query}|{max_results}|{start}"
+        return hashlib.sha1(key.encode()).hexdigest()
+    
+    def get(self, query: str, max_results: int,
+            start: int = 0) -> Optional[List[ArxivPaper]]:
+        """Return cached papers for a search, or None if missing or stale."""
+        row = self.conn.execute(
+            "SELECT payload FROM searches WHERE key = ? AND ts > ?",
+            (self.make_key(query, max_results, start),
+             int(time.time() - self.ttl))
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+    
+    def set(self, query: str, max_results: int, start: int,
+            papers: List[ArxivPaper]) -> None:
+        """Store the papers returned by a search."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO searches (key, ts, payload) "
+            "VALUES (?, ?, ?)",
+            (self.make_key(query, max_results, start), int(time.time()),
+             pickle.dumps(papers))
+        )
+        self.conn.commit()
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
 
 class ArxivDownloader:
     """ArXiv paper downloader with search and download capabilities."""
     
-    def __init__(self, download_dir: Optional[Path] = None):
+    def __init__(self, download_dir: Optional[Path] = None,
+                 revalidate: bool = False,
+                 use_search_cache: bool = False):
         """Initialize the ArXiv downloader.
         
         Args:
             download_dir: Directory to save downloaded papers.
                          Defaults to RAW_DATA_DIR.
+            revalidate: Re-check existing PDFs with a conditional request
+                        (If-None-Match on the stored ETag) instead of
+                        always skipping them. Defaults to False.
+            use_search_cache: Reuse results of identical searches made in
+                              the last 6 hours, stored in the download
+                              directory. Results may then miss papers
+                              published since the cached search.
+                              Defaults to False.
         """
         self.download_dir = download_dir or RAW_DATA_DIR
+        self.revalidate = revalidate
         self.download_dir.mkdir(parents=True, exist_ok=True)
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.search_cache: Optional[_SearchCache] = None
+        if use_search_cache:
+            self.search_cache = _SearchCache(
+                self.download_dir / '.search_cache.sqlite'
+            )
+        self.session: Optional[httpx.AsyncClient] = None
         self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
         
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=300)
-        )
+        self.session = await _get_shared_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit.
+        
+        The shared session is left open for later downloaders on the same
+        event loop; it is closed when the loop shuts down, or earlier by
+        close_shared_session.
+        """
+        self.session = None
+        if self.search_cache is not None:
+            self.search_cache.close()
     
     def _build_search_url(self, query: str, max_results: int = 10,
                           start: int = 0) -> str:
@@ -122,13 +390,14 @@ class ArxivDownloader:
         }
         return f"{ARXIV_BASE_URL}?{urlencode(params)}"
     
-    async def search_papers(self, query: str,
-                            max_results: int = 10) -> List[ArxivPaper]:
+    async def search_papers(self, query: str, max_results: int = 10,
+                            start: int = 0) -> List[ArxivPaper]:
         """Search for papers on ArXiv.
         
         Args:
             query: Search query (can include categories, keywords, etc.)
             max_results: Maximum number of results to return
+            start: Index of the first result, for paging through results
             
         Returns:
             List of ArxivPaper objects
@@ -137,103 +406,181 @@ class ArxivDownloader:
             msg = "ArxivDownloader must be used as async context manager"
             raise RuntimeError(msg)
         
-        url = self._build_search_url(query, max_results)
+        if self.search_cache is not None:
+            cached = self.search_cache.get(query, max_results, start)
+            if cached is not None:
+                console.print(
+                    f"[blue]Using cached results for query:[/blue] {query}"
+                )
+                return cached
+        
+        url = self._build_search_url(query, max_results, start)
         console.print(f"[blue]Searching ArXiv with query:[/blue] {query}")
         
         try:
-            async with self.session.get(url) as response:
+            async with self.session.stream('GET', url) as response:
                 response.raise_for_status()
-                xml_content = await response.text()
-                return self._parse_arxiv_response(xml_content)
+                
+                # Parse entries as the response streams in
+                parser = _etree.XMLPullParser(events=('end',))
+                papers = []
+                async for chunk in response.aiter_bytes(65536):
+                    parser.feed(chunk)
+                    papers.extend(self._read_parsed_entries(parser))
+                parser.close()
+                papers.extend(self._read_parsed_entries(parser))
+        except _XML_PARSE_ERRORS as e:
+            logger.error(f"Failed to parse XML response: {e}")
+            console.print(f"[red]XML parsing failed: {e}[/red]")
+            return []
         except Exception as e:
             logger.error(f"Failed to search ArXiv: {e}")
             console.print(f"[red]Search failed: {e}[/red]")
             return []
+        
+        if self.search_cache is not None:
+            self.search_cache.set(query, max_results, start, papers)
+        return papers
     
-    def _parse_arxiv_response(self, xml_content: str) -> List[ArxivPaper]:
-        """Parse ArXiv API XML response."""
-        try:
-            root = ET.fromstring(xml_content)
-            papers = []
-            
-            # Define namespace
-            ns = {'atom': 'http://www.w3.org/2005/Atom',
-                  'arxiv': 'http://arxiv.org/schemas/atom'}
-            
-            for entry in root.findall('atom:entry', ns):
-                try:
-                    # Extract basic info
-                    entry_id = entry.find('atom:id', ns).text
-                    arxiv_id = entry_id.split('/')[-1].split('v')[0]
-                    title = entry.find('atom:title', ns).text
-                    
-                    # Extract authors
-                    authors = []
-                    for author in entry.findall('atom:author', ns):
-                        name_elem = author.find('atom:name', ns)
-                        if name_elem is not None:
-                            authors.append(name_elem.text)
-                    
-                    # Extract abstract
-                    summary_elem = entry.find('atom:summary', ns)
-                    if summary_elem is not None:
-                        abstract = summary_elem.text
-                    else:
-                        abstract = ""
-                    
-                    # Extract categories
-                    categories = []
-                    for category in entry.findall('atom:category', ns):
-                        term = category.get('term')
-                        if term:
-                            categories.append(term)
-                    
-                    # Extract publication date
-                    published_elem = entry.find('atom:published', ns)
-                    if published_elem is not None:
-                        published_str = published_elem.text
-                    else:
-                        published_str = ""
-                    published = datetime.fromisoformat(
-                        published_str.replace('Z', '+00:00')
-                    )
-                    
-                    # Find PDF link
-                    pdf_url = ""
-                    for link in entry.findall('atom:link', ns):
-                        if link.get('type') == 'application/pdf':
-                            pdf_url = link.get('href', '')
-                            break
-                    
-                    if not pdf_url:
-                        pdf_url = f"http://arxiv.org/pdf/{arxiv_id}.pdf"
-                    
-                    paper = ArxivPaper(
-                        arxiv_id=arxiv_id,
-                        title=title,
-                        authors=authors,
-                        abstract=abstract,
-                        categories=categories,
-                        published=published,
-                        pdf_url=pdf_url,
-                        entry_id=entry_id
-                    )
-                    papers.append(paper)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse entry: {e}")
-                    continue
+    async def _search_pages(
+            self, query: str, max_results: int,
+            page_size: int = _SEARCH_PAGE_SIZE
+    ) -> AsyncIterator[List[ArxivPaper]]:
+        """Search ArXiv page by page, yielding each page once parsed.
+        
+        Stops early when a page comes back short, i.e. results ran out.
+        """
+        for start in range(0, max_results, page_size):
+            if start:
+                await asyncio.sleep(_SEARCH_PAGE_DELAY)
             
+            count = min(page_size, max_results - start)
+            page = await self.search_papers(query, count, start)
+            if page:
+                yield page
+            if len(page) < count:
+                return
+    
+    def _parse_arxiv_response(
+            self, xml_content: Union[str, bytes]
+    ) -> List[ArxivPaper]:
+        """Parse ArXiv API XML response.
+        
+        Raw response bytes are fed to the parser as-is; text is encoded
+        back to UTF-8 first.
+        """
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode('utf-8')
+        
+        parser = _etree.XMLPullParser(events=('end',))
+        try:
+            parser.feed(xml_content)
+            papers = self._read_parsed_entries(parser)
+            parser.close()
+            papers.extend(self._read_parsed_entries(parser))
             return papers
             
-        except ET.ParseError as e:
+        except _XML_PARSE_ERRORS as e:
             logger.error(f"Failed to parse XML response: {e}")
             console.print(f"[red]XML parsing failed: {e}[/red]")
             return []
     
+    def _read_parsed_entries(self, parser) -> List[ArxivPaper]:
+        """Convert the entries completed so far by a pull parser to papers.
+        
+        Each entry is cleared once parsed (and, with lxml, detached from the
+        tree) so memory stays bounded by a single entry.
+        """
+        papers = []
+        for _, elem in parser.read_events():
+            if elem.tag != _ATOM_ENTRY_TAG:
+                continue
+            
+            paper = self._parse_entry(elem)
+            if paper is not None:
+                papers.append(paper)
+            
+            elem.clear()
+            if hasattr(elem, 'getprevious'):
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        return papers
+    
+    def _parse_entry(self, entry) -> Optional[ArxivPaper]:
+        """Parse a single Atom entry element into an ArxivPaper.
+        
+        The entry's children are walked once, dispatching on their tag,
+        rather than searching the entry again for every field.
+        """
+        try:
+            id_elem = title_elem = summary_elem = published_elem = None
+            pdf_url = ""
+            authors = []
+            categories = []
+            
+            for child in entry:
+                tag = child.tag
+                if tag == _TAG_AUTHOR:
+                    name_elem = child.find(_TAG_NAME)
+                    if name_elem is not None:
+                        authors.append(name_elem.text)
+                elif tag == _TAG_CATEGORY:
+                    term = child.get('term')
+                    if term:
+                        categories.append(term)
+                elif tag == _TAG_LINK:
+                    if not pdf_url and child.get('type') == 'application/pdf':
+                        pdf_url = child.get('href', '')
+                elif tag == _TAG_ID:
+                    if id_elem is None:
+                        id_elem = child
+                elif tag == _TAG_TITLE:
+                    if title_elem is None:
+                        title_elem = child
+                elif tag == _TAG_SUMMARY:
+                    if summary_elem is None:
+                        summary_elem = child
+                elif tag == _TAG_PUBLISHED:
+                    if published_elem is None:
+                        published_elem = child
+            
+            if id_elem is None or title_elem is None:
+                raise ValueError("entry is missing its id or title")
+            
+            entry_id = id_elem.text
+            title = title_elem.text
+            abstract = summary_elem.text if summary_elem is not None else ""
+            if published_elem is not None:
+                published_str = published_elem.text
+            else:
+                published_str = ""
+            
+            arxiv_id = entry_id.split('/')[-1].split('v')[0]
+            # fromisoformat accepts the trailing 'Z' natively since 3.11
+            published = datetime.fromisoformat(published_str)
+            
+            if not pdf_url:
+                pdf_url = f"http://arxiv.org/pdf/{arxiv_id}.pdf"
+            
+            return ArxivPaper(
+                arxiv_id=arxiv_id,
+                title=title,
+                authors=authors,
+                abstract=abstract,
+                categories=categories,
+                published=published,
+                pdf_url=pdf_url,
+                entry_id=entry_id
+            )
+            
+        except Exception as e:
+            logger.warning(f"Failed to parse entry: {e}")
+            return None
+    
     async def download_paper(self, paper: ArxivPaper,
                              progress: Optional[Progress] = None,
-                             task_id: Optional[int] = None
+                             task_id: Optional[int] = None,
+                             existing_files: Optional[Set[str]] = None
                              ) -> Optional[Path]:
         """Download a single paper PDF.
         
@@ -241,6 +588,8 @@ class ArxivDownloader:
             paper: ArxivPaper object to download
             progress: Rich progress object for display
             task_id: Progress task ID for updates
+            existing_files: Names of the files in the download directory,
+                            used instead of checking each path on disk
             
         Returns:
             Path to downloaded file or None if failed
@@ -250,48 +599,137 @@ class ArxivDownloader:
                 msg = "ArxivDownloader must be used as async context manager"
                 raise RuntimeError(msg)
             
-            # Create filename
-            safe_title = re.sub(r'[<>:"/\\|?*]', '_', paper.title[:50])
-            filename = f"{paper.arxiv_id}_{safe_title}.pdf"
-            filepath = self.download_dir / filename
+            # Papers are looked up by ArXiv ID, so metadata changes (e.g. a
+            # revised title) don't trigger a new download
+            key = self.download_dir / paper.arxiv_id
+            etag_path = self.download_dir / f"{paper.arxiv_id}.etag"
             
-            # Skip if already exists
-            if filepath.exists():
-                if progress and task_id:
-                    desc = f"[green]Skipped[/green] {paper.arxiv_id}"
-                    progress.update(task_id, description=desc)
-                return filepath
+            # Skip if already fetched in this process and still on disk;
+            # revalidation always goes to the server
+            if not self.revalidate:
+                known_path = _DOWNLOADED_PATHS.get(key)
+                if known_path is not None:
+                    if self._file_exists(known_path, existing_files):
+                        _DOWNLOADED_PATHS.move_to_end(key)
+                        self._report(progress, task_id,
+                                     "[green]Skipped[/green]", paper)
+                        return known_path
+                    del _DOWNLOADED_PATHS[key]
+            
+            # Skip existing files unless asked to revalidate them
+            headers = {}
+            filepath = self._saved_filepath(paper, existing_files)
+            if filepath is not None:
+                etag = None
+                if self.revalidate and self._file_exists(
+                        etag_path, existing_files):
+                    etag = (await asyncio.to_thread(
+                        etag_path.read_text)).strip()
+                if not etag:
+                    _remember_download(key, filepath)
+                    self._report(progress, task_id,
+                                 "[green]Skipped[/green]", paper)
+                    return filepath
+                headers['If-None-Match'] = etag
+            else:
+                # The preprocessor reads the title from the filename
+                filepath = self._filepath(paper)
             
+            # Write to a temporary file so a failed refresh keeps the
+            # existing copy intact
+            partial_path = filepath.with_suffix('.pdf.part')
             try:
-                if progress and task_id:
-                    desc = f"[blue]Downloading[/blue] {paper.arxiv_id}"
-                    progress.update(task_id, description=desc)
-                
-                async with self.session.get(paper.pdf_url) as response:
+                async with self.session.stream(
+                    'GET', paper.pdf_url, headers=headers
+                ) as response:
+                    if response.status_code == 304:
+                        _remember_download(key, filepath)
+                        self._report(progress, task_id,
+                                     "[green]Unchanged[/green]", paper)
+                        return filepath
+                    
                     response.raise_for_status()
                     
-                    async with aiofiles.open(filepath, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            await f.write(chunk)
+                    content_length = response.headers.get('Content-Length')
+                    if (content_length is not None
+                            and int(content_length) < _SINGLE_WRITE_MAX_BYTES):
+                        # Small PDFs: one read and one write
+                        data = await response.aread()
+                        await asyncio.to_thread(
+                            partial_path.write_bytes, data
+                        )
+                    else:
+                        async with aiofiles.open(partial_path, 'wb') as f:
+                            async for chunk in response.aiter_bytes(
+                                _DOWNLOAD_CHUNK_BYTES
+                            ):
+                                await f.write(chunk)
+                    
+                    partial_path.replace(filepath)
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        await asyncio.to_thread(etag_path.write_text, etag)
                 
-                if progress and task_id:
-                    desc = f"[green]Downloaded[/green] {paper.arxiv_id}"
-                    progress.update(task_id, description=desc)
+                _remember_download(key, filepath)
+                self._report(progress, task_id, "[green]Downloaded[/green]",
+                             paper)
                 
                 return filepath
                 
             except Exception as e:
                 logger.error(f"Failed to download {paper.arxiv_id}: {e}")
-                if progress and task_id:
-                    desc = f"[red]Failed[/red] {paper.arxiv_id}"
-                    progress.update(task_id, description=desc)
+                self._report(progress, task_id, "[red]Failed[/red]", paper)
                 
                 # Clean up partial file
-                if filepath.exists():
-                    filepath.unlink()
+                if partial_path.exists():
+                    partial_path.unlink()
                 
                 return None
     
+    @staticmethod
+    def _file_exists(path: Path,
+                     existing_files: Optional[Set[str]] = None) -> bool:
+        """Check for a file, using a directory listing when available."""
+        if existing_files is not None:
+            return path.name in existing_files
+        return path.exists()
+    
+    def _filepath(self, paper: ArxivPaper) -> Path:
+        """Path a paper is saved to, named by ArXiv ID and title."""
+        safe_title = _UNSAFE_FILENAME_RE.sub('_', paper.title[:50])
+        return self.download_dir / f"{paper.arxiv_id}_{safe_title}.pdf"
+    
+    def _saved_filepath(self, paper: ArxivPaper,
+                        existing_files: Optional[Set[str]] = None
+                        ) -> Optional[Path]:
+        """Find a saved copy of a paper, whatever title it was saved under.
+        
+        Returns:
+            Path to the saved PDF, or None if the paper isn't downloaded
+        """
+        filepath = self._filepath(paper)
+        if self._file_exists(filepath, existing_files):
+            return filepath
+        
+        prefix = f"{paper.arxiv_id}_"
+        if existing_files is not None:
+            names = [name for name in existing_files
+                     if name.startswith(prefix) and name.endswith('.pdf')]
+        else:
+            names = [path.name for path in self.download_dir.glob(
+                glob.escape(prefix) + '*.pdf'
+            )]
+        if not names:
+            return None
+        return self.download_dir / min(names)
+    
+    @staticmethod
+    def _report(progress: Optional[Progress], task_id: Optional[int],
+                status: str, paper: ArxivPaper) -> None:
+        """Show a paper's download status on its progress task."""
+        if progress and task_id:
+            progress.update(task_id, description=f"{status} {paper.arxiv_id}")
+    
     async def download_papers(
             self, papers: List[ArxivPaper]
     ) -> List[Tuple[ArxivPaper, Optional[Path]]]:
@@ -309,15 +747,11 @@ class ArxivDownloader:
         
         console.print(f"[blue]Downloading {len(papers)} papers...[/blue]")
         
-        results = []
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeRemainingColumn(),
-            console=console,
-        ) as progress:
+        # List the download directory once instead of stat-ing every path
+        with os.scandir(self.download_dir) as entries:
+            existing_files = {entry.name for entry in entries}
+        
+        with self._make_progress() as progress:
             
             # Create tasks for each paper
             tasks = []
@@ -326,32 +760,117 @@ class ArxivDownloader:
                 task_id = progress.add_task(desc, total=1)
                 tasks.append((paper, task_id))
             
-            # Download papers concurrently
-            download_tasks = [
-                self.download_paper(paper, progress, task_id)
-                for paper, task_id in tasks
-            ]
+            # Download papers concurrently; each task reports its own
+            # progress as soon as it finishes
+            async with asyncio.TaskGroup() as task_group:
+                download_tasks = [
+                    task_group.create_task(
+                        self._download_and_report(
+                            paper, progress, task_id, existing_files
+                        )
+                    )
+                    for paper, task_id in tasks
+                ]
             
-            downloaded_paths = await asyncio.gather(
-                *download_tasks, return_exceptions=True
-            )
+            # Collect results in input order
+            results = [
+                (paper, download_task.result())
+                for (paper, _), download_task in zip(tasks, download_tasks)
+            ]
+        
+        self._print_download_summary(results)
+        return results
+    
+    async def download_search_results(
+            self, query: str, max_results: int = 10
+    ) -> List[Tuple[ArxivPaper, Optional[Path]]]:
+        """Search for papers and download them, one result page at a time.
+        
+        Downloads for a page start as soon as it has been parsed, while the
+        next page is being fetched, instead of waiting for the whole search.
+        
+        Args:
+            query: Search query
+            max_results: Maximum papers to download
             
-            # Collect results
-            for (paper, task_id), result in zip(tasks, downloaded_paths):
-                if isinstance(result, Exception):
-                    desc = f"[red]Error[/red] {paper.arxiv_id}"
-                    progress.update(task_id, description=desc)
-                    results.append((paper, None))
-                else:
-                    progress.advance(task_id)
-                    results.append((paper, result))
-        
-        # Summary
-        successful = sum(1 for _, path in results if path is not None)
-        console.print(f"\n[green]Download complete:[/green] {successful}/{len(papers)} papers downloaded")
+        Returns:
+            List of (paper, filepath) tuples in search result order
+        """
+        # List the download directory once instead of stat-ing every path
+        with os.scandir(self.download_dir) as entries:
+            existing_files = {entry.name for entry in entries}
+        
+        downloads = []
+        with self._make_progress() as progress:
+            async with asyncio.TaskGroup() as task_group:
+                async for page in self._search_pages(query, max_results):
+                    self.display_papers(page)
+                    for paper in page:
+                        desc = f"Queued {paper.arxiv_id}"
+                        task_id = progress.add_task(desc, total=1)
+                        download_task = task_group.create_task(
+                            self._download_and_report(
+                                paper, progress, task_id, existing_files
+                            )
+                        )
+                        downloads.append((paper, download_task))
         
+        if not downloads:
+            console.print("[yellow]No papers found[/yellow]")
+            return []
+        
+        results = [
+            (paper, download_task.result())
+            for paper, download_task in downloads
+        ]
+        self._print_download_summary(results)
         return results
     
+    @staticmethod
+    def _make_progress() -> Progress:
+        """Create the progress display used for downloads."""
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeRemainingColumn(),
+            console=console,
+            # Redraws cost O(tasks); a few per second is enough to follow
+            refresh_per_second=4,
+        )
+    
+    @staticmethod
+    def _print_download_summary(
+            results: List[Tuple[ArxivPaper, Optional[Path]]]
+    ) -> None:
+        """Print how many of the papers were downloaded."""
+        successful = sum(1 for _, path in results if path is not None)
+        console.print(f"\n[green]Download complete:[/green] {successful}/{len(results)} papers downloaded")
+    
+    async def _download_and_report(self, paper: ArxivPaper,
+                                   progress: Progress,
+                                   task_id: int,
+                                   existing_files: Optional[Set[str]] = None
+                                   ) -> Optional[Path]:
+        """Download a paper and update its progress task when done.
+        
+        Errors are reported on the progress task instead of raised, so one
+        failure doesn't cancel the sibling downloads in the task group.
+        """
+        try:
+            result = await self.download_paper(
+                paper, progress, task_id, existing_files
+            )
+        except Exception as e:
+            logger.error(f"Failed to download {paper.arxiv_id}: {e}")
+            desc = f"[red]Error[/red] {paper.arxiv_id}"
+            progress.update(task_id, description=desc)
+            return None
+        
+        progress.advance(task_id)
+        return result
+    
     def display_papers(self, papers: List[ArxivPaper]) -> None:
         """Display papers in a formatted table."""
         if not papers:
@@ -366,17 +885,17 @@ class ArxivDownloader:
         table.add_column("Published", style="blue", width=12)
         
         for paper in papers:
-            authors_str = ", ".join(paper.authors[:2])
+            authors_str = ", ".join(islice(paper.authors, 2))
             if len(paper.authors) > 2:
                 authors_str += f" +{len(paper.authors)-2}"
             
-            categories_str = ", ".join(paper.categories[:2])
+            categories_str = ", ".join(islice(paper.categories, 2))
             if len(paper.categories) > 2:
                 categories_str += "..."
             
             table.add_row(
                 paper.arxiv_id,
-                paper.title[:47] + "..." if len(paper.title) > 50 else paper.title,
+                paper.display_title,
                 authors_str,
                 categories_str,
                 paper.published.strftime("%Y-%m-%d")
@@ -386,37 +905,53 @@ class ArxivDownloader:
 
 
 async def download_papers_by_query(query: str, max_results: int = 10,
-                                  download_dir: Optional[Path] = None) -> List[Tuple[ArxivPaper, Optional[Path]]]:
+                                  download_dir: Optional[Path] = None,
+                                  use_search_cache: bool = False) -> List[Tuple[ArxivPaper, Optional[Path]]]:
     """Download papers by search query.
     
     Args:
         query: Search query
         max_results: Maximum papers to download
         download_dir: Directory to save papers
+        use_search_cache: Reuse search results up to 6 hours old instead of
+                          querying ArXiv again (see ArxivDownloader)
         
     Returns:
         List of (paper, filepath) tuples
     """
-    async with ArxivDownloader(download_dir) as downloader:
+    async with ArxivDownloader(
+        download_dir, use_search_cache=use_search_cache
+    ) as downloader:
+        if max_results > _SEARCH_PAGE_SIZE:
+            # Overlap fetching later result pages with earlier downloads
+            return await downloader.download_search_results(
+                query, max_results
+            )
+        
         papers = await downloader.search_papers(query, max_results)
         downloader.display_papers(papers)
         return await downloader.download_papers(papers)
 
 
 async def download_papers_by_category(category: str, max_results: int = 10,
-                                     download_dir: Optional[Path] = None) -> List[Tuple[ArxivPaper, Optional[Path]]]:
+                                     download_dir: Optional[Path] = None,
+                                     use_search_cache: bool = False) -> List[Tuple[ArxivPaper, Optional[Path]]]:
     """Download papers by ArXiv category.
     
     Args:
         category: ArXiv category (e.g., 'cs.AI', 'math.CO')
         max_results: Maximum papers to download
         download_dir: Directory to save papers
+        use_search_cache: Reuse search results up to 6 hours old instead of
+                          querying ArXiv again (see ArxivDownloader)
         
     Returns:
         List of (paper, filepath) tuples
     """
     query = f"cat:{category}"
-    return await download_papers_by_query(query, max_results, download_dir)
+    return await download_papers_by_query(
+        query, max_results, download_dir, use_search_cache
+    )
 
 
 if __name__ == "__main__":
@@ -445,6 +980,8 @@ if __name__ == "__main__":
                     args.query, args.max_results, args.output_dir
                 )
             
+            await close_shared_session()
+            
             successful = sum(1 for _, path in results if path is not None)
             console.print(f"\n[bold green]Summary:[/bold green] Downloaded {successful}/{len(results)} papers")
         
@@ -6,6 +6,7 @@ import argparse
 import logging
 import sys
 import os
+from dataclasses import replace
 from dotenv import load_dotenv
 
 from .config import IndexerConfig
@@ -108,15 +109,13 @@ def main():
             os.environ['TYPESENSE_ADMIN_API_KEY'] = 'xyz'
 
         # Initialize configuration and indexer
-        config = IndexerConfig()
+        config = IndexerConfig.from_env(max_documents=args.max_documents)
 
         # Override defaults for development if needed
         if not config.typesense_api_key:
-            config.typesense_api_key = 'xyz'
+            config = replace(config, typesense_api_key='xyz')
         # Don't override host - let it use the Docker service name from environment
 
-        config.max_documents = args.max_documents
-
         indexer = TypesenseIndexer(config)
 
         # Handle different commands
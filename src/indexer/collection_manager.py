@@ -3,10 +3,14 @@ Collection manager for Typesense collections.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# How long a collection existence check is trusted, in seconds
+_EXISTS_TTL = 30.0
+
 
 class CollectionManager:
     """Manages Typesense collections for indexing."""
@@ -15,39 +19,76 @@ class CollectionManager:
         """Initialize collection manager."""
         self.client = typesense_client
         self.default_schema_template = default_schema_template
+        # Template fields are shared by every schema; only the embedding
+        # field differs (by num_dim) and is copied per schema
+        self._template_fields = tuple(default_schema_template["fields"])
+        self._embedding_field_index = next(
+            (i for i, field in enumerate(self._template_fields)
+             if field["name"] == "embedding"),
+            None
+        )
+        # Built schemas keyed by (collection_name, embedding_dimensions)
+        self._schema_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        # Existence check results as name -> (exists, expiry time)
+        self._exists_cache: Dict[str, Tuple[bool, float]] = {}
     
     def create_collection_schema(self, collection_name: str,
                                 extraction_method: str,
                                 chunking_strategy: str,
                                 embedding_dimensions: int = 384) -> Dict[str, Any]:
-        """Create collection schema for the given parameters."""
-        schema = {
-            "name": collection_name,
-            "fields": []
-        }
+        """Create collection schema for the given parameters.
         
-        # Copy fields from template
-        for field in self.default_schema_template["fields"]:
-            field_copy = field.copy()
-            
-            # Update embedding dimensions if needed
-            if field_copy["name"] == "embedding":
-                field_copy["num_dim"] = embedding_dimensions
-            
-            schema["fields"].append(field_copy)
+        Schemas are built once per (collection_name, embedding_dimensions)
+        and the same dict is returned on later calls, so callers must not
+        modify it.
+        """
+        key = (collection_name, embedding_dimensions)
+        schema = self._schema_cache.get(key)
+        if schema is None:
+            schema = self._build_schema(collection_name, embedding_dimensions)
+            self._schema_cache[key] = schema
+        return schema
+    
+    def _build_schema(self, collection_name: str,
+                      embedding_dimensions: int) -> Dict[str, Any]:
+        """Build a collection schema from the template."""
+        fields = list(self._template_fields)
         
-        # Set default sorting field
-        schema["default_sorting_field"] = "chunk_index"
+        # Update embedding dimensions if needed
+        index = self._embedding_field_index
+        if index is not None:
+            fields[index] = {**fields[index], "num_dim": embedding_dimensions}
         
-        return schema
+        return {
+            "name": collection_name,
+            "fields": fields,
+            # Set default sorting field
+            "default_sorting_field": "chunk_index"
+        }
     
     def collection_exists(self, collection_name: str) -> bool:
-        """Check if collection exists."""
+        """Check if collection exists.
+        
+        Results are cached for a short time, and updated whenever this
+        manager creates or deletes the collection.
+        """
+        cached = self._exists_cache.get(collection_name)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
         try:
             self.client.collections[collection_name].retrieve()
-            return True
+            exists = True
         except Exception:
-            return False
+            exists = False
+        self._set_exists(collection_name, exists)
+        return exists
+    
+    def _set_exists(self, collection_name: str, exists: bool) -> None:
+        """Record whether a collection exists."""
+        self._exists_cache[collection_name] = (
+            exists, time.monotonic() + _EXISTS_TTL
+        )
     
     def create_collection(self, collection_name: str,
                          extraction_method: str,
@@ -60,6 +101,7 @@ class CollectionManager:
                 if force_recreate:
                     logger.info(f"Deleting existing collection: {collection_name}")
                     self.client.collections[collection_name].delete()
+                    self._set_exists(collection_name, False)
                 else:
                     logger.info(f"Collection {collection_name} already exists")
                     return True
@@ -72,7 +114,8 @@ class CollectionManager:
             logger.info(f"Creating collection: {collection_name}")
             self.client.collections.create(schema)
             
-            # Verify creation
+            # Verify creation against the server, not the cache
+            self._exists_cache.pop(collection_name, None)
             if self.collection_exists(collection_name):
                 logger.info(f"Collection {collection_name} created successfully")
                 return True
@@ -90,6 +133,7 @@ class CollectionManager:
             if self.collection_exists(collection_name):
                 logger.info(f"Deleting collection: {collection_name}")
                 self.client.collections[collection_name].delete()
+                self._set_exists(collection_name, False)
                 return True
             else:
                 logger.warning(f"Collection {collection_name} does not exist")
@@ -3,24 +3,37 @@ Configuration for the indexer module.
 """
 
 import os
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 
-@dataclass
+@lru_cache(maxsize=64)
+def _collection_name(collection_prefix: str, extraction_method: str,
+                     chunking_strategy: str) -> str:
+    """Build a collection name; memoized since the inputs repeat."""
+    base_name = f"{extraction_method}_{chunking_strategy}"
+    if collection_prefix:
+        return f"{collection_prefix}_{base_name}"
+    return base_name
+
+
+@dataclass(frozen=True, slots=True)
 class IndexerConfig:
     """Configuration for the Typesense indexer."""
 
-    # Typesense connection
-    typesense_host: str = os.getenv('TYPESENSE_HOST', 'localhost')
-    typesense_port: int = int(os.getenv('TYPESENSE_PORT', '8108'))
-    typesense_protocol: str = os.getenv('TYPESENSE_PROTOCOL', 'http')
-    typesense_api_key: str = os.getenv('TYPESENSE_ADMIN_API_KEY', '')
+    # Typesense connection (see from_env for the environment variables)
+    typesense_host: str = 'localhost'
+    typesense_port: int = 8108
+    typesense_protocol: str = 'http'
+    typesense_api_key: str = ''
 
     # Embedding configuration
     embedding_model: str = 'sentence-transformers/all-MiniLM-L6-v2'
     embedding_dimensions: int = 384
-    batch_size: int = 100
+    # Documents per embedding pass and per import request
+    batch_size: int = 1000
+    embedding_backend: str = 'torch'  # 'torch' or 'onnx' (CPU inference)
 
     # Processing configuration
     max_documents: int = -1  # -1 means all documents
@@ -29,32 +42,69 @@ class IndexerConfig:
     # Data paths
     processed_data_path: str = '/workspace/data/processed'
     chunks_data_path: str = '/workspace/data/chunks'
+    # SQLite file persisting chunk embeddings across runs; '' disables it
+    embedding_cache_path: str = '/workspace/data/cache/index_embeddings.db'
 
     # Collection configuration
     collection_prefix: str = ''
     default_sorting_field: str = 'chunk_index'
 
+    # Built once in __post_init__; see typesense_nodes
+    _typesense_nodes: List[Dict[str, Any]] = field(
+        init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.max_documents == 0:
             raise ValueError("max_documents cannot be 0")
 
-    @property
-    def typesense_nodes(self) -> list:
-        """Get Typesense nodes configuration."""
-        return [{
+        # The instance is frozen, so the nodes can be computed up front
+        object.__setattr__(self, '_typesense_nodes', [{
             'host': self.typesense_host,
             'port': self.typesense_port,
             'protocol': self.typesense_protocol
-        }]
+        }])
+
+    @classmethod
+    def from_env(cls, **overrides: Any) -> 'IndexerConfig':
+        """Create a configuration from the TYPESENSE_* environment variables.
+
+        Args:
+            **overrides: Field values that take precedence over the
+                         environment and the defaults
+
+        Raises:
+            ValueError: If TYPESENSE_PORT is not an integer
+        """
+        env = os.environ
+        port = env.get('TYPESENSE_PORT', '8108')
+        try:
+            port = int(port)
+        except ValueError:
+            raise ValueError(
+                f"TYPESENSE_PORT must be an integer, got {port!r}"
+            ) from None
+
+        values = {
+            'typesense_host': env.get('TYPESENSE_HOST', 'localhost'),
+            'typesense_port': port,
+            'typesense_protocol': env.get('TYPESENSE_PROTOCOL', 'http'),
+            'typesense_api_key': env.get('TYPESENSE_ADMIN_API_KEY', ''),
+        }
+        values.update(overrides)
+        return cls(**values)
+
+    @property
+    def typesense_nodes(self) -> List[Dict[str, Any]]:
+        """Get Typesense nodes configuration."""
+        return self._typesense_nodes
 
     def get_collection_name(self, extraction_method: str,
                             chunking_strategy: str) -> str:
         """Generate collection name for extraction method and strategy."""
-        base_name = f"{extraction_method}_{chunking_strategy}"
-        if self.collection_prefix:
-            return f"{self.collection_prefix}_{base_name}"
-        return base_name
+        return _collection_name(self.collection_prefix, extraction_method,
+                                chunking_strategy)
 
 
 # Default collection schema
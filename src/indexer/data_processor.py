@@ -2,14 +2,136 @@
 Data processor for preparing documents for indexing.
 """
 
-import json
 import logging
 import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+import msgspec
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, preparing documents serially beats thread start-up
+_MIN_FILES_FOR_THREADS = 4
+# Cap on concurrent file loads; reads block on I/O, so this exceeds CPUs
+_MAX_LOAD_WORKERS = 32
+
+# Known extraction methods, used to split chunk file names of the form
+# {document_id}_{extraction_method}_{strategy}; strategies can contain
+# underscores, so the split is anchored on the first method marker
+_KNOWN_METHODS = ('pypdf', 'unstructured', 'marker', 'markitdown')
+_STRATEGY_RE = re.compile(
+    r'^.*?_(?P<method>' + '|'.join(_KNOWN_METHODS) + r')_(?P<strategy>.+)$'
+)
+
+
+# Schemas of the processed-document and chunk files. Only the fields used
+# for indexing are declared; everything else (full text, elements, ...) is
+# skipped by the decoder without being materialized. Values keep their JSON
+# types, with the same defaults as before.
+
+
+class ProcessedDocumentInfo(msgspec.Struct, frozen=True):
+    """Indexed fields of a processed document.
+
+    Frozen, since loaded instances are cached and shared.
+    """
+
+    document_id: Any = None
+    title: Any = ''
+    file_name: Any = ''
+
+
+class ChunkMetadata(msgspec.Struct):
+    """Indexed fields of a chunk's metadata."""
+
+    chunk_index: Any = 0
+    total_chunks: Any = 0
+    title: Any = ''
+    authors: Any = None
+
+
+class Chunk(msgspec.Struct):
+    """Indexed fields of a chunk."""
+
+    chunk_id: Any = ''
+    # Defaults to the chunking strategy being indexed
+    strategy_name: Any = msgspec.UNSET
+    content: Any = ''
+    token_count: Any = 0
+    start_position: Any = 0
+    end_position: Any = 0
+    created_at: Any = ''
+    metadata: ChunkMetadata = msgspec.field(default_factory=ChunkMetadata)
+
+
+class ChunkResults(msgspec.Struct):
+    """Chunking results of a chunks file."""
+
+    chunks: List[Chunk]
+
+
+class StrategyConfig(msgspec.Struct):
+    """Strategy configuration of a chunks file."""
+
+    parameters: Optional[Dict[str, Any]] = None
+
+
+class ProcessingMetadata(msgspec.Struct):
+    """Processing metrics of a chunks file; absent metrics stay UNSET."""
+
+    processing_time: Any = msgspec.UNSET
+    memory_usage: Any = msgspec.UNSET
+    cpu_usage_percent: Any = msgspec.UNSET
+    gpu_usage_percent: Any = msgspec.UNSET
+
+
+class DocumentInfo(msgspec.Struct):
+    """Source document information of a chunks file."""
+
+    # Defaults to the extraction method being indexed
+    preprocessing_method: Any = msgspec.UNSET
+    content_length: Any = msgspec.UNSET
+
+
+class ChunksFile(msgspec.Struct):
+    """A chunks file in the new format (results.chunks is required)."""
+
+    results: ChunkResults
+    strategy_config: StrategyConfig = msgspec.field(
+        default_factory=StrategyConfig)
+    processing_metadata: ProcessingMetadata = msgspec.field(
+        default_factory=ProcessingMetadata)
+    document_info: DocumentInfo = msgspec.field(default_factory=DocumentInfo)
+
+
+_PROCESSED_DOCUMENT_DECODER = msgspec.json.Decoder(ProcessedDocumentInfo)
+_CHUNKS_FILE_DECODER = msgspec.json.Decoder(ChunksFile)
+
+
+def _intern(value: Any) -> Any:
+    """Intern decoded strings that repeat across many index documents."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=2048)
+def _load_processed_document(file_path: str) -> ProcessedDocumentInfo:
+    """Decode a processed document, memoized across strategy sweeps."""
+    return _PROCESSED_DOCUMENT_DECODER.decode(Path(file_path).read_bytes())
+
+
+@lru_cache(maxsize=None)
+def _method_strategy_re(extraction_method: str) -> re.Pattern:
+    """Compile the chunk file name pattern for one extraction method."""
+    return re.compile(
+        r'^.*?_' + re.escape(extraction_method) + r'_(?P<strategy>.+)$'
+    )
+
 
 class DataProcessor:
     """Processes document data for indexing."""
@@ -18,14 +140,35 @@ class DataProcessor:
         """Initialize data processor."""
         self.processed_data_path = Path(processed_data_path)
         self.chunks_data_path = Path(chunks_data_path)
+        # Names of the files in chunks_data_path, listed on first use
+        self._chunks_index: Optional[Set[str]] = None
+
+    def invalidate_cache(self) -> None:
+        """Forget cached file listings and processed documents.
+
+        Call after new chunks are written or processed files change.
+        """
+        self._chunks_index = None
+        _load_processed_document.cache_clear()
+
+    def _ensure_chunks_index(self) -> Set[str]:
+        """Get the names of the chunk files, scanning the directory once."""
+        if self._chunks_index is None:
+            try:
+                with os.scandir(self.chunks_data_path) as entries:
+                    self._chunks_index = {entry.name for entry in entries}
+            except FileNotFoundError:
+                self._chunks_index = set()
+        return self._chunks_index
 
     def get_available_extraction_methods(self) -> List[str]:
         """Get list of available extraction methods."""
-        methods = []
-        for item in self.processed_data_path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                methods.append(item.name)
-        return sorted(methods)
+        # DirEntry caches the entry type, saving a stat call per entry
+        with os.scandir(self.processed_data_path) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if entry.is_dir() and not entry.name.startswith('.')
+            )
 
     def get_processed_files(self, extraction_method: str,
                             max_documents: int = -1) -> List[Path]:
@@ -33,16 +176,20 @@ class DataProcessor:
         method_path = self.processed_data_path / extraction_method
 
         if not method_path.exists():
-            logger.warning(f"Path not found: {method_path}")
+            logger.warning("Path not found: %s", method_path)
             return []
 
         # Get all JSON files
-        json_files = list(method_path.glob("*.json"))
+        with os.scandir(method_path) as entries:
+            json_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
 
         if max_documents > 0:
             json_files = json_files[:max_documents]
-            logger.info(f"Limited to {len(json_files)} documents for "
-                        f"{extraction_method}")
+            logger.info("Limited to %d documents for %s",
+                        len(json_files), extraction_method)
 
         return sorted(json_files)
 
@@ -51,100 +198,84 @@ class DataProcessor:
         """Get chunks file for a document with the new format."""
         pattern = (f"{document_id}_{extraction_method}_"
                    f"{chunking_strategy}.json")
-        chunks_file = self.chunks_data_path / pattern
 
-        if chunks_file.exists():
-            return chunks_file
+        if pattern in self._ensure_chunks_index():
+            return self.chunks_data_path / pattern
 
         logger.warning("No chunks file found for %s_%s_%s",
                        document_id, extraction_method, chunking_strategy)
         return None
 
     def load_processed_document(self, file_path: Path) -> Optional[
-            Dict[str, Any]]:
-        """Load a processed document."""
+            ProcessedDocumentInfo]:
+        """Load the indexed fields of a processed document.
+
+        Documents are cached by path, so indexing the same corpus with
+        several chunking strategies reads each file only once.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
+            return _load_processed_document(str(file_path))
+        except (IOError, msgspec.DecodeError) as e:
             logger.error("Error loading processed document %s: %s",
                          file_path, e)
             return None
 
-    def load_chunks_data(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    def load_chunks_data(self, file_path: Path) -> Optional[ChunksFile]:
         """Load chunks data in the new format."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
+            return _CHUNKS_FILE_DECODER.decode(Path(file_path).read_bytes())
+        except msgspec.ValidationError as e:
             # Validate new format structure
-            if 'results' in data and 'chunks' in data['results']:
-                return data
-            else:
-                logger.error("Invalid chunks data format in %s - "
-                             "missing 'results.chunks'", file_path)
-                return None
-
-        except (IOError, json.JSONDecodeError) as e:
+            logger.error("Invalid chunks data format in %s: %s",
+                         file_path, e)
+            return None
+        except (IOError, msgspec.DecodeError) as e:
             logger.error("Error loading chunks data %s: %s", file_path, e)
             return None
 
     def get_available_strategies(self) -> List[str]:
         """Get available chunking strategies by scanning chunk files."""
-        strategies = set()
-
-        # Scan all chunk files to find strategies
-        for chunk_file in self.chunks_data_path.glob("*.json"):
-            # Parse filename: {document_id}_{extraction_method}_{strategy}.json
-            # Strategy can contain underscores, so we need to be careful
-            filename = chunk_file.stem
-
-            # Try to find extraction method and strategy
-            # Known extraction methods to help with parsing
-            known_methods = ['pypdf', 'unstructured', 'marker', 'markitdown']
-
-            for method in known_methods:
-                if f"_{method}_" in filename:
-                    # Find the strategy part after the extraction method
-                    method_pos = filename.find(f"_{method}_")
-                    strategy_start = method_pos + len(f"_{method}_")
-                    strategy = filename[strategy_start:]
-                    if strategy:
-                        strategies.add(strategy)
-                    break
-
-        return sorted(list(strategies))
+        return self._scan_strategies(_STRATEGY_RE)
 
     def get_available_strategies_for_extraction_method(self,
                                                        extraction_method: str
                                                        ) -> List[str]:
         """Get available strategies for a specific extraction method."""
+        return self._scan_strategies(_method_strategy_re(extraction_method))
+
+    def _scan_strategies(self, pattern: re.Pattern) -> List[str]:
+        """Collect the strategy names matched in the chunk file names."""
         strategies = set()
 
-        # Scan chunk files for this extraction method
-        pattern = f"*_{extraction_method}_*.json"
-        for chunk_file in self.chunks_data_path.glob(pattern):
-            # Parse filename: {document_id}_{extraction_method}_{strategy}.json
-            filename = chunk_file.stem
+        # Parse filename: {document_id}_{extraction_method}_{strategy}.json
+        for name in self._ensure_chunks_index():
+            if not name.endswith('.json'):
+                continue
 
-            # Find the strategy part after the extraction method
-            method_marker = f"_{extraction_method}_"
-            method_pos = filename.find(method_marker)
-            if method_pos != -1:
-                strategy_start = method_pos + len(method_marker)
-                strategy = filename[strategy_start:]
-                if strategy:
-                    strategies.add(strategy)
+            match = pattern.match(name[:-len('.json')])
+            if match:
+                strategies.add(match.group('strategy'))
 
-        return sorted(list(strategies))
+        return sorted(strategies)
 
     def prepare_documents_for_indexing(self, extraction_method: str,
                                        chunking_strategy: str,
                                        max_documents: int = -1) -> List[
                                            Dict[str, Any]]:
         """Prepare documents for indexing with new format support."""
-        documents = []
-
+        return list(self.iter_documents_for_indexing(
+            extraction_method, chunking_strategy, max_documents
+        ))
+
+    def iter_documents_for_indexing(self, extraction_method: str,
+                                    chunking_strategy: str,
+                                    max_documents: int = -1) -> Iterator[
+                                        Dict[str, Any]]:
+        """Yield documents for indexing, a processed file at a time.
+
+        Only a bounded window of files is loaded ahead of the consumer, so
+        memory doesn't grow with the size of the corpus.
+        """
         # Get processed files
         processed_files = self.get_processed_files(extraction_method,
                                                    max_documents)
@@ -153,106 +284,197 @@ class DataProcessor:
                     len(processed_files), extraction_method,
                     chunking_strategy)
 
-        for file_path in processed_files:
-            # Load processed document
-            processed_doc = self.load_processed_document(file_path)
-            if not processed_doc:
+        # List the chunk files up front rather than from the worker threads
+        self._ensure_chunks_index()
+
+        count = 0
+        for file_documents in self._iter_file_documents(
+                processed_files, extraction_method, chunking_strategy):
+            count += len(file_documents)
+            yield from file_documents
+
+        logger.info("Prepared %d documents for indexing", count)
+
+    def iter_batches(self, extraction_method: str, chunking_strategy: str,
+                     batch_size: int, max_documents: int = -1,
+                     exclude_chunk_ids: Optional[Set[str]] = None) -> Iterator[
+                         List[Dict[str, Any]]]:
+        """Yield documents for indexing in lists of at most batch_size.
+
+        Documents whose chunk_id is in exclude_chunk_ids are skipped, so
+        batches stay full when resuming into a partially indexed collection.
+        """
+        batch = []
+        for doc in self.iter_documents_for_indexing(
+                extraction_method, chunking_strategy, max_documents):
+            if exclude_chunk_ids and doc["chunk_id"] in exclude_chunk_ids:
                 continue
-
-            # Extract document info
-            document_id = processed_doc.get('document_id')
-            if not document_id:
-                logger.warning("No document_id in %s", file_path)
-                continue
-
-            # Use strategy-aware file discovery
-            chunks_file = self.get_chunks_file(document_id, extraction_method,
-                                               chunking_strategy)
-            if not chunks_file:
-                continue
-
-            chunks_data = self.load_chunks_data(chunks_file)
-            if not chunks_data:
-                continue
-
-            # Process chunks (same logic as before, but simpler access)
-            if ('results' not in chunks_data or
-                    'chunks' not in chunks_data['results']):
-                logger.warning("No chunks in data for %s", document_id)
-                continue
-
-            # Create documents for indexing
-            for chunk in chunks_data['results']['chunks']:
-                doc = self._create_index_document(
-                    processed_doc, chunk, extraction_method,
-                    chunking_strategy, chunks_data
+            batch.append(doc)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _iter_file_documents(self, processed_files: List[Path],
+                             extraction_method: str,
+                             chunking_strategy: str) -> Iterator[
+                                 List[Dict[str, Any]]]:
+        """Yield the index documents of each processed file, in order."""
+        if len(processed_files) < _MIN_FILES_FOR_THREADS:
+            for file_path in processed_files:
+                yield self._prepare_file_documents(
+                    file_path, extraction_method, chunking_strategy
                 )
-                if doc:
-                    documents.append(doc)
-
-        logger.info("Prepared %d documents for indexing", len(documents))
-        return documents
+            return
+
+        # File reads release the GIL, so loading overlaps across threads;
+        # at most two files per worker are loaded ahead of the consumer
+        workers = min(_MAX_LOAD_WORKERS, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for file_path in processed_files:
+                pending.append(executor.submit(
+                    self._prepare_file_documents, file_path,
+                    extraction_method, chunking_strategy
+                ))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _prepare_file_documents(self, file_path: Path,
+                                extraction_method: str,
+                                chunking_strategy: str) -> List[
+                                    Dict[str, Any]]:
+        """Build the index documents for one processed file."""
+        documents = []
 
-    def _create_index_document(self, processed_doc: Dict[str, Any],
-                               chunk: Dict[str, Any], extraction_method: str,
+        # Load processed document
+        processed_doc = self.load_processed_document(file_path)
+        if not processed_doc:
+            return documents
+
+        # Extract document info
+        document_id = processed_doc.document_id
+        if not document_id:
+            logger.warning("No document_id in %s", file_path)
+            return documents
+
+        # Use strategy-aware file discovery
+        chunks_file = self.get_chunks_file(document_id, extraction_method,
+                                           chunking_strategy)
+        if not chunks_file:
+            return documents
+
+        chunks_data = self.load_chunks_data(chunks_file)
+        if not chunks_data:
+            return documents
+
+        # Fields shared by every chunk of the document are looked up once
+        shared = self._document_index_fields(
+            processed_doc, extraction_method, chunking_strategy, chunks_data
+        )
+
+        # Create documents for indexing
+        create_index_document = self._create_index_document
+        return [create_index_document(chunk, shared)
+                for chunk in chunks_data.results.chunks]
+
+    def _document_index_fields(self, processed_doc: ProcessedDocumentInfo,
+                               extraction_method: str,
                                chunking_strategy: str,
-                               chunks_data: Dict[str, Any]) -> Optional[
-                                   Dict[str, Any]]:
-        """Create a document for indexing with enhanced metadata."""
-        try:
-            # Extract metadata from chunk
-            metadata = chunk.get('metadata', {})
-
-            # Get strategy config and processing metadata from chunks_data
-            strategy_config = chunks_data.get('strategy_config', {})
-            processing_metadata = chunks_data.get('processing_metadata', {})
-            doc_info = chunks_data.get('document_info', {})
-
-            # Create the document with all available fields
-            doc = {
-                "chunk_id": chunk.get('chunk_id', ''),
-                "document_id": processed_doc.get('document_id', ''),
-                "document_title": (processed_doc.get('title', '') or
-                                   metadata.get('title', '')),
-                "document_filename": processed_doc.get('file_name', ''),
-                "extraction_method": extraction_method,
-                "chunking_strategy": chunking_strategy,
-                "strategy_name": chunk.get('strategy_name', chunking_strategy),
-                "content": chunk.get('content', ''),
-                "token_count": chunk.get('token_count', 0),
-                "chunk_index": metadata.get('chunk_index', 0),
-                "total_chunks": metadata.get('total_chunks', 0),
-                "start_position": chunk.get('start_position', 0),
-                "end_position": chunk.get('end_position', 0),
-                "created_at": chunk.get('created_at', ''),
-                "preprocessing_method": doc_info.get(
-                    'preprocessing_method', extraction_method),
-                "content_length": doc_info.get('content_length', 0),
-                "processing_time": processing_metadata.get(
-                    'processing_time', 0),
-                "memory_usage": processing_metadata.get('memory_usage', 0),
-                "cpu_usage_percent": processing_metadata.get(
-                    'cpu_usage_percent', 0),
-                "gpu_usage_percent": processing_metadata.get(
-                    'gpu_usage_percent', 0),
+                               chunks_data: ChunksFile) -> Dict[str, Any]:
+        """Collect the index fields that are the same for every chunk."""
+        # Get strategy config and processing metadata from chunks_data
+        params = chunks_data.strategy_config.parameters
+        processing_metadata = chunks_data.processing_metadata
+        doc_info = chunks_data.document_info
+
+        preprocessing_method = doc_info.preprocessing_method
+        if preprocessing_method is msgspec.UNSET:
+            preprocessing_method = extraction_method
+        else:
+            preprocessing_method = _intern(preprocessing_method)
+
+        # These schema fields are optional, so metrics missing from the
+        # chunks file are left out instead of being indexed as zeros
+        metrics = {
+            name: value for name, value in (
+                ("content_length", doc_info.content_length),
+                ("processing_time", processing_metadata.processing_time),
+                ("memory_usage", processing_metadata.memory_usage),
+                ("cpu_usage_percent",
+                 processing_metadata.cpu_usage_percent),
+                ("gpu_usage_percent",
+                 processing_metadata.gpu_usage_percent),
+            )
+            if value is not msgspec.UNSET
+        }
+
+        shared = {
+            "document_id": processed_doc.document_id,
+            "document_title": processed_doc.title,
+            "document_filename": processed_doc.file_name,
+            "extraction_method": extraction_method,
+            "chunking_strategy": chunking_strategy,
+            "preprocessing_method": preprocessing_method,
+            "metrics": metrics,
+            "parameters": None,
+        }
+
+        # Add strategy parameters from new format
+        if params is not None:
+            shared["parameters"] = {
+                "chunk_size": params.get('chunk_size', 0),
+                "chunk_overlap": params.get('overlap', 0),
+                "encoding_name": _intern(params.get('encoding_name', '')),
             }
 
-            # Add authors if available
-            authors = metadata.get('authors', [])
-            if authors:
-                doc["authors"] = authors
-
-            # Add strategy parameters from new format
-            if 'parameters' in strategy_config:
-                params = strategy_config['parameters']
-                doc.update({
-                    "chunk_size": params.get('chunk_size', 0),
-                    "chunk_overlap": params.get('overlap', 0),
-                    "encoding_name": params.get('encoding_name', ''),
-                })
-
-            return doc
-
-        except (KeyError, TypeError, ValueError) as e:
-            logger.error("Error creating index document: %s", e)
-            return None
+        return shared
+
+    def _create_index_document(self, chunk: Chunk,
+                               shared: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a document for indexing with enhanced metadata.
+
+        Args:
+            chunk: Chunk to index
+            shared: Per-document fields from _document_index_fields
+        """
+        metadata = chunk.metadata
+        strategy_name = chunk.strategy_name
+        if strategy_name is msgspec.UNSET:
+            strategy_name = shared["chunking_strategy"]
+        else:
+            # Decoded once per chunk, but shared by the whole strategy
+            strategy_name = _intern(strategy_name)
+
+        # Create the document with all available fields
+        doc = {
+            "chunk_id": chunk.chunk_id,
+            "document_id": shared["document_id"],
+            "document_title": shared["document_title"] or metadata.title,
+            "document_filename": shared["document_filename"],
+            "extraction_method": shared["extraction_method"],
+            "chunking_strategy": shared["chunking_strategy"],
+            "strategy_name": strategy_name,
+            "content": chunk.content,
+            "token_count": chunk.token_count,
+            "chunk_index": metadata.chunk_index,
+            "total_chunks": metadata.total_chunks,
+            "start_position": chunk.start_position,
+            "end_position": chunk.end_position,
+            "created_at": chunk.created_at,
+            "preprocessing_method": shared["preprocessing_method"],
+        }
+        doc.update(shared["metrics"])
+
+        # Add authors if available
+        if metadata.authors:
+            doc["authors"] = metadata.authors
+
+        # Add strategy parameters from new format
+        if shared["parameters"] is not None:
+            doc.update(shared["parameters"])
+
+        return doc
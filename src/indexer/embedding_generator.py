@@ -3,27 +3,59 @@ Embedding generator for document chunks.
 """
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_BACKENDS = ('torch', 'onnx')
+
 
 class EmbeddingGenerator:
     """Generates embeddings for text using sentence transformers."""
     
-    def __init__(self, model_name: str = 'sentence-transformers/all-MiniLM-L6-v2'):
-        """Initialize the embedding generator."""
+    def __init__(self, model_name: str = 'sentence-transformers/all-MiniLM-L6-v2',
+                 cache_path: Optional[str] = None,
+                 batch_size: Optional[int] = None,
+                 backend: str = 'torch'):
+        """Initialize the embedding generator.
+
+        Args:
+            model_name: Sentence transformer model to embed with
+            cache_path: SQLite file persisting embeddings across runs, so
+                        unchanged texts are never re-encoded; None disables
+            batch_size: Number of texts per model forward pass; defaults
+                        to 256 on GPU, where larger batches keep the device
+                        busy between host transfers, and 128 on CPU
+            backend: Inference backend, 'torch' or 'onnx' (ONNX Runtime on
+                     CPU, requires optimum[onnxruntime])
+
+        Raises:
+            ValueError: If backend is not supported
+        """
+        if backend not in _BACKENDS:
+            raise ValueError("backend must be 'torch' or 'onnx'")
+
         self.model_name = model_name
         self.model = None
+        self.cache_path = cache_path
+        self.batch_size = batch_size
+        self.backend = backend
+        self._cache = None
         
     def _load_model(self):
         """Lazy load the sentence transformer model."""
         if self.model is None:
             try:
                 from sentence_transformers import SentenceTransformer
-                logger.info(f"Loading embedding model: {self.model_name}")
-                self.model = SentenceTransformer(self.model_name)
+                logger.info(f"Loading embedding model: {self.model_name} "
+                            f"({self.backend} backend)")
+                self.model = SentenceTransformer(
+                    self.model_name, **self._model_kwargs()
+                )
+                if self.batch_size is None:
+                    on_gpu = self.model.device.type == 'cuda'
+                    self.batch_size = 256 if on_gpu else 128
                 logger.info("Embedding model loaded successfully")
             except ImportError as e:
                 raise ImportError(
@@ -31,6 +63,64 @@ class EmbeddingGenerator:
                     "Install it with: pip install sentence-transformers"
                 ) from e
     
+    def _model_kwargs(self) -> Dict[str, Any]:
+        """Build SentenceTransformer kwargs for the configured backend.
+
+        ONNX Runtime's fused kernels are much faster than eager PyTorch on
+        CPU-only nodes; with torch, the model runs in half precision on GPU.
+        """
+        if self.backend == 'onnx':
+            return {
+                'backend': 'onnx',
+                'device': 'cpu',
+                'model_kwargs': {'provider': 'CPUExecutionProvider'}
+            }
+
+        try:
+            import torch
+        except ImportError:
+            return {}
+
+        if not torch.cuda.is_available():
+            return {}
+        return {
+            'device': 'cuda',
+            'model_kwargs': {'torch_dtype': torch.float16}
+        }
+
+    def _model_encode(self, texts: List[str]) -> np.ndarray:
+        """Run the model on texts, returning a float32 array."""
+        embeddings = self.model.encode(
+            texts, batch_size=self.batch_size, show_progress_bar=False,
+            convert_to_numpy=True
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _get_cache(self):
+        """Lazily open the persistent embedding cache, if configured."""
+        if self._cache is None and self.cache_path:
+            from ..chunker.embedding_cache import EmbeddingCache
+            self._cache = EmbeddingCache(self.cache_path)
+        return self._cache
+
+    def _encode_cached(self, texts: List[str], cache) -> np.ndarray:
+        """Encode texts, running the model only on cache misses."""
+        cached = cache.get_many(self.model_name, texts)
+        miss_idx = [i for i, vec in enumerate(cached) if vec is None]
+
+        if miss_idx:
+            self._load_model()
+            miss_texts = [texts[i] for i in miss_idx]
+            # Rounded to the cache's float16 so hits and misses agree
+            new = self._model_encode(miss_texts).astype(np.float16)
+            cache.set_many(self.model_name, miss_texts, new)
+            for j, i in enumerate(miss_idx):
+                cached[i] = new[j]
+
+        logger.debug(f"Embedding cache: {len(texts) - len(miss_idx)} hits, "
+                     f"{len(miss_idx)} misses")
+        return np.stack(cached).astype(np.float32)
+
     def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for a single text."""
         return self.generate_embeddings([text])[0]
@@ -39,19 +129,38 @@ class EmbeddingGenerator:
         """Generate embeddings for a batch of texts."""
         if not texts:
             return []
+        return self.encode(texts).tolist()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for a batch of texts as a float32 array.
+
+        Rows can be serialized directly (e.g. by orjson), skipping the
+        conversion to nested Python lists.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
         
-        self._load_model()
+        # Identical texts (e.g. boilerplate chunks) are encoded only once
+        # and their embedding is copied to every position they occur at
+        unique = {}
+        positions = [unique.setdefault(text, len(unique)) for text in texts]
+        unique_texts = list(unique)
+
+        cache = self._get_cache()
+        if cache is None:
+            self._load_model()
         
         try:
-            logger.debug(f"Generating embeddings for {len(texts)} texts")
-            embeddings = self.model.encode(texts)
-            
-            # Convert numpy arrays to lists
-            if isinstance(embeddings, np.ndarray):
-                return embeddings.tolist()
-            
-            return [emb.tolist() if isinstance(emb, np.ndarray) else emb 
-                   for emb in embeddings]
+            logger.debug(f"Generating embeddings for {len(unique_texts)} "
+                         f"unique texts out of {len(texts)}")
+            if cache is None:
+                embeddings = self._model_encode(unique_texts)
+            else:
+                embeddings = self._encode_cached(unique_texts, cache)
+
+            if len(unique_texts) < len(texts):
+                embeddings = embeddings[positions]
+            return embeddings
                    
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
@@ -65,7 +174,7 @@ class EmbeddingGenerator:
     
     def get_embedding_dimensions(self) -> int:
         """Get the dimension of embeddings produced by this model."""
-        self._load_model()
-        # Generate a test embedding to get dimensions
+        # Generate a test embedding to get dimensions (from the cache
+        # when possible, so fully cached runs never load the model)
         test_embedding = self.generate_embedding("test")
         return len(test_embedding)
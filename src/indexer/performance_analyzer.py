@@ -5,10 +5,25 @@ Performance analytics module for analyzing chunking strategy performance.
 import logging
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
+import numpy as np
 import typesense
 
 logger = logging.getLogger(__name__)
 
+# Only the fields read by _calculate_stats_from_docs are fetched, which
+# keeps the (large) embedding vectors out of analytics responses
+_STATS_FIELDS = ('chunking_strategy,extraction_method,content,'
+                 'processing_time,memory_usage,cpu_usage_percent')
+
+# Numeric fields whose facet stats (min/max/avg) the summary is built from
+_STATS_FACETS = 'processing_time,memory_usage,cpu_usage_percent,token_count'
+
+# Summary sections keyed by the field their groups are faceted on
+_SUMMARY_GROUPS = {
+    'chunking_strategy': 'by_strategy',
+    'extraction_method': 'by_extraction'
+}
+
 
 @dataclass
 class PerformanceMetrics:
@@ -54,18 +69,46 @@ class PerformanceAnalyzer:
             Dictionary with performance summary
         """
         try:
-            # Simple aggregation query to get basic stats
-            search_params = {
+            # Group sizes over the whole collection, counted by the server
+            response = self.client.collections[collection_name].documents.search({
                 'q': '*',
                 'query_by': 'content',
-                'per_page': 250,  # Get a sample of documents
-                'sort_by': 'processing_time:desc'
+                'facet_by': ','.join(_SUMMARY_GROUPS),
+                'max_facet_values': 100,
+                'per_page': 0
+            })
+
+            groups = [
+                (facet['field_name'], count['value'], count['count'])
+                for facet in response.get('facet_counts', [])
+                for count in facet['counts']
+            ]
+            if not groups:
+                return {}
+
+            # Per-group metric stats, aggregated server-side in one request
+            group_responses = self._multi_search(collection_name, [
+                {
+                    'q': '*',
+                    'query_by': 'content',
+                    'filter_by': f'{field}:={value}',
+                    'facet_by': _STATS_FACETS,
+                    'per_page': 0
+                }
+                for field, value, _ in groups
+            ])
+
+            summary = {
+                'total_documents': response.get('found', 0),
+                'by_strategy': {},
+                'by_extraction': {}
             }
+            for (field, value, count), group_response in zip(
+                    groups, group_responses):
+                summary[_SUMMARY_GROUPS[field]][value] = (
+                    self._calculate_stats_from_facets(count, group_response))
 
-            response = self.client.collections[collection_name].documents.search(
-                search_params)
-
-            return self._analyze_performance_data(response)
+            return summary
 
         except Exception as e:
             logger.error("Error getting performance summary: %s", e)
@@ -91,6 +134,7 @@ class PerformanceAnalyzer:
                 'q': '*',
                 'query_by': 'content',
                 'filter_by': f'chunking_strategy:={strategy_a}',
+                'include_fields': _STATS_FIELDS,
                 'per_page': 100
             }
 
@@ -98,13 +142,13 @@ class PerformanceAnalyzer:
                 'q': '*',
                 'query_by': 'content',
                 'filter_by': f'chunking_strategy:={strategy_b}',
+                'include_fields': _STATS_FIELDS,
                 'per_page': 100
             }
 
-            response_a = self.client.collections[collection_name].documents.search(
-                params_a)
-            response_b = self.client.collections[collection_name].documents.search(
-                params_b)
+            # Both searches share a single round-trip
+            response_a, response_b = self._multi_search(
+                collection_name, [params_a, params_b])
 
             stats_a = self._calculate_stats(response_a)
             stats_b = self._calculate_stats(response_b)
@@ -162,46 +206,44 @@ class PerformanceAnalyzer:
             logger.error("Error finding optimal strategy: %s", e)
             return None
 
-    def _analyze_performance_data(self, response: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze performance data from search response."""
-        hits = response.get('hits', [])
-
-        if not hits:
-            return {}
-
-        # Group by strategy
-        by_strategy = {}
-        by_extraction = {}
+    def _multi_search(self, collection_name: str,
+                      searches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several searches against a collection in one request.
 
-        for hit in hits:
-            doc = hit.get('document', {})
-            strategy = doc.get('chunking_strategy', 'unknown')
-            extraction = doc.get('extraction_method', 'unknown')
-
-            # Add to strategy groups
-            if strategy not in by_strategy:
-                by_strategy[strategy] = []
-            by_strategy[strategy].append(doc)
-
-            # Add to extraction groups
-            if extraction not in by_extraction:
-                by_extraction[extraction] = []
-            by_extraction[extraction].append(doc)
-
-        # Calculate stats for each group
-        strategy_stats = {}
-        for strategy, docs in by_strategy.items():
-            strategy_stats[strategy] = self._calculate_stats_from_docs(docs)
-
-        extraction_stats = {}
-        for extraction, docs in by_extraction.items():
-            extraction_stats[extraction] = self._calculate_stats_from_docs(
-                docs)
+        Returns:
+            One response per search, in order; failed searches carry an
+            'error' key instead of hits
+        """
+        response = self.client.multi_search.perform(
+            {'searches': [dict(search, collection=collection_name)
+                          for search in searches]},
+            {}
+        )
+        return response['results']
+
+    def _calculate_stats_from_facets(self, document_count: int,
+                                     response: Dict[str, Any]) -> Dict[str, float]:
+        """Calculate statistics from the facet stats of a search response.
+
+        Documents without a metric don't contribute to its statistics.
+        """
+        stats = {
+            facet['field_name']: facet.get('stats', {})
+            for facet in response.get('facet_counts', [])
+        }
+        processing_time = stats.get('processing_time', {})
+        memory_usage = stats.get('memory_usage', {})
 
         return {
-            'total_documents': len(hits),
-            'by_strategy': strategy_stats,
-            'by_extraction': extraction_stats
+            'document_count': document_count,
+            'avg_processing_time': processing_time.get('avg', 0),
+            'avg_memory_usage': memory_usage.get('avg', 0),
+            'avg_cpu_usage': stats.get('cpu_usage_percent', {}).get('avg', 0),
+            'avg_token_count': stats.get('token_count', {}).get('avg', 0),
+            'min_processing_time': processing_time.get('min', 0),
+            'max_processing_time': processing_time.get('max', 0),
+            'min_memory_usage': memory_usage.get('min', 0),
+            'max_memory_usage': memory_usage.get('max', 0)
         }
 
     def _calculate_stats(self, response: Dict[str, Any]) -> Dict[str, float]:
@@ -214,19 +256,24 @@ class PerformanceAnalyzer:
         if not docs:
             return {}
 
-        processing_times = [doc.get('processing_time', 0) for doc in docs]
-        memory_usages = [doc.get('memory_usage', 0) for doc in docs]
-        cpu_usages = [doc.get('cpu_usage_percent', 0) for doc in docs]
-        content_lengths = [len(doc.get('content', '')) for doc in docs]
+        # One row per document, reduced column-wise in a single pass each
+        values = np.array([
+            (doc.get('processing_time', 0), doc.get('memory_usage', 0),
+             doc.get('cpu_usage_percent', 0), len(doc.get('content', '')))
+            for doc in docs
+        ], dtype=np.float64)
+        avg_time, avg_memory, avg_cpu, avg_length = values.mean(axis=0)
+        min_time, min_memory = values[:, :2].min(axis=0)
+        max_time, max_memory = values[:, :2].max(axis=0)
 
         return {
             'document_count': len(docs),
-            'avg_processing_time': sum(processing_times) / len(processing_times),
-            'avg_memory_usage': sum(memory_usages) / len(memory_usages),
-            'avg_cpu_usage': sum(cpu_usages) / len(cpu_usages),
-            'avg_content_length': sum(content_lengths) / len(content_lengths),
-            'min_processing_time': min(processing_times) if processing_times else 0,
-            'max_processing_time': max(processing_times) if processing_times else 0,
-            'min_memory_usage': min(memory_usages) if memory_usages else 0,
-            'max_memory_usage': max(memory_usages) if memory_usages else 0
+            'avg_processing_time': float(avg_time),
+            'avg_memory_usage': float(avg_memory),
+            'avg_cpu_usage': float(avg_cpu),
+            'avg_content_length': float(avg_length),
+            'min_processing_time': float(min_time),
+            'max_processing_time': float(max_time),
+            'min_memory_usage': float(min_memory),
+            'max_memory_usage': float(max_memory)
         }
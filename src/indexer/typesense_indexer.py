@@ -2,8 +2,10 @@
 Main Typesense indexer implementation.
 """
 
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set
 import typesense
 from .base import BaseIndexer
 from .config import IndexerConfig, COLLECTION_SCHEMA_TEMPLATE
@@ -12,15 +14,35 @@ from .collection_manager import CollectionManager
 from .data_processor import DataProcessor
 from .performance_analyzer import PerformanceAnalyzer
 
+# orjson encodes import payloads (mostly embedding floats) much faster,
+# and serializes the numpy embedding rows without converting them to lists
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _is_payload_too_large(error: Exception) -> bool:
+    """Check whether a Typesense client error is an HTTP 413 response.
+
+    The client has no exception class for 413; it raises the generic
+    TypesenseClientError with the status code as its first argument.
+    """
+    status = getattr(error, 'status_code', None)
+    if status is None and error.args:
+        status = error.args[0]
+    return status == 413 or 'Entity Too Large' in str(error)
+
+
 class TypesenseIndexer(BaseIndexer):
     """Main Typesense indexer for document chunks."""
 
     def __init__(self, config: Optional[IndexerConfig] = None):
         """Initialize Typesense indexer."""
-        self.config = config or IndexerConfig()
+        self.config = config or IndexerConfig.from_env()
 
         # Initialize Typesense client
         typesense_config = {
@@ -36,7 +58,9 @@ class TypesenseIndexer(BaseIndexer):
 
         # Initialize components
         self.embedding_generator = EmbeddingGenerator(
-            self.config.embedding_model
+            self.config.embedding_model,
+            cache_path=self.config.embedding_cache_path,
+            backend=self.config.embedding_backend
         )
         self.collection_manager = CollectionManager(
             self.client, COLLECTION_SCHEMA_TEMPLATE
@@ -75,9 +99,7 @@ class TypesenseIndexer(BaseIndexer):
                 return {"success": True, "indexed": 0}
 
             # Use Typesense's import endpoint for bulk indexing
-            results = self.client.collections[collection_name].documents.import_(
-                documents, {'action': 'create'}
-            )
+            results = self._import_documents(collection_name, documents)
 
             # Parse results
             success_count = 0
@@ -103,6 +125,45 @@ class TypesenseIndexer(BaseIndexer):
             logger.error(f"Error indexing documents: {e}")
             return {"success": False, "indexed": 0, "errors": len(documents)}
 
+    def _import_documents(self, collection_name: str,
+                          documents: List[Dict[str, Any]]) -> List[
+                              Dict[str, Any]]:
+        """Send documents to the import endpoint, returning their results.
+
+        With orjson the JSONL payload is encoded here, in one pass, instead
+        of by the client's per-document json.dumps; the client then returns
+        the raw JSONL response, which is parsed back into result dicts.
+
+        Batches rejected as too large (HTTP 413) are split in half and
+        each half is imported separately, recursively.
+        """
+        import_documents = self.client.collections[
+            collection_name].documents.import_
+        # Let the server ingest the whole request in one internal batch
+        # rather than in its default groups of 40 documents
+        params = {'action': 'create', 'batch_size': self.config.batch_size}
+        try:
+            if orjson is None:
+                return import_documents(documents, params)
+
+            payload = b'\n'.join(
+                orjson.dumps(doc, option=_ORJSON_OPTIONS)
+                for doc in documents
+            ).decode('utf-8')
+            response = import_documents(payload, params)
+        except typesense.exceptions.TypesenseClientError as e:
+            if len(documents) < 2 or not _is_payload_too_large(e):
+                raise
+            middle = len(documents) // 2
+            logger.warning(f"Import of {len(documents)} documents was too "
+                           f"large, retrying as two batches of {middle} and "
+                           f"{len(documents) - middle}")
+            return (
+                self._import_documents(collection_name, documents[:middle])
+                + self._import_documents(collection_name, documents[middle:])
+            )
+        return [orjson.loads(line) for line in response.splitlines() if line]
+
     def search(self, collection_name: str,
                query: Dict[str, Any]) -> Dict[str, Any]:
         """Perform a search query."""
@@ -140,47 +201,75 @@ class TypesenseIndexer(BaseIndexer):
                 logger.error(f"Failed to create collection: {collection_name}")
                 return False
 
-            # Prepare documents
-            documents = self.data_processor.prepare_documents_for_indexing(
-                extraction_method, chunking_strategy, max_documents
+            # Chunks already in a kept collection are neither re-embedded
+            # nor re-imported
+            indexed_chunk_ids = set()
+            if not force_recreate:
+                indexed_chunk_ids = self._indexed_chunk_ids(collection_name)
+                if indexed_chunk_ids:
+                    logger.info(f"Skipping {len(indexed_chunk_ids)} chunks "
+                                f"already in {collection_name}")
+
+            # Stream documents and index them in batches
+            batches = self.data_processor.iter_batches(
+                extraction_method, chunking_strategy,
+                self.config.batch_size, max_documents, indexed_chunk_ids
             )
 
-            if not documents:
-                logger.warning(f"No documents found for {collection_name}")
-                return True
-
-            # Generate embeddings and index in batches
             total_indexed = 0
-            batch_size = self.config.batch_size
-
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1} of "
-                            f"{(len(documents) - 1)//batch_size + 1} "
-                            f"({len(batch)} documents)")
-
-                # Generate embeddings for batch
-                texts = [
-                    self.embedding_generator.create_embedding_text(
-                        doc['document_title'], doc['content']
+            batch_number = 0
+            pending = None
+
+            # One upload runs in the background while the next batch is
+            # loaded and embedded, so network and compute overlap
+            with ThreadPoolExecutor(max_workers=1) as uploader:
+                for batch in batches:
+                    batch_number += 1
+                    logger.info(f"Processing batch {batch_number} "
+                                f"({len(batch)} documents)")
+
+                    # Generate embeddings for batch
+                    texts = [
+                        self.embedding_generator.create_embedding_text(
+                            doc['document_title'], doc['content']
+                        )
+                        for doc in batch
+                    ]
+
+                    embeddings = self.embedding_generator.encode(texts)
+                    if orjson is None:
+                        embeddings = embeddings.tolist()
+
+                    # Add embeddings to documents
+                    for doc, embedding in zip(batch, embeddings):
+                        doc['embedding'] = embedding
+
+                    # Wait for the previous batch before queueing this one
+                    if pending is not None:
+                        indexed = self._batch_indexed(*pending)
+                        if indexed is None:
+                            return False
+                        total_indexed += indexed
+
+                    pending = (
+                        batch_number,
+                        uploader.submit(self.index_documents,
+                                        collection_name, batch)
                     )
-                    for doc in batch
-                ]
-
-                embeddings = self.embedding_generator.generate_embeddings(
-                    texts)
 
-                # Add embeddings to documents
-                for doc, embedding in zip(batch, embeddings):
-                    doc['embedding'] = embedding
+                if pending is not None:
+                    indexed = self._batch_indexed(*pending)
+                    if indexed is None:
+                        return False
+                    total_indexed += indexed
 
-                # Index batch
-                result = self.index_documents(collection_name, batch)
-                if result['success']:
-                    total_indexed += result['indexed']
+            if batch_number == 0:
+                if indexed_chunk_ids:
+                    logger.info(f"No new documents for {collection_name}")
                 else:
-                    logger.error(f"Failed to index batch {i//batch_size + 1}")
-                    return False
+                    logger.warning(
+                        f"No documents found for {collection_name}")
+                return True
 
             logger.info(f"Successfully indexed {total_indexed} documents "
                         f"in collection {collection_name}")
@@ -190,6 +279,23 @@ class TypesenseIndexer(BaseIndexer):
             logger.error(f"Error indexing {collection_name}: {e}")
             return False
 
+    def _indexed_chunk_ids(self, collection_name: str) -> Set[str]:
+        """Get the chunk_ids of the documents already in a collection."""
+        exported = self.client.collections[collection_name].documents.export(
+            {'include_fields': 'chunk_id'})
+        loads = orjson.loads if orjson is not None else json.loads
+        return {loads(line)['chunk_id']
+                for line in exported.splitlines() if line}
+
+    @staticmethod
+    def _batch_indexed(batch_number: int, upload) -> Optional[int]:
+        """Return the documents indexed by an upload, or None on failure."""
+        result = upload.result()
+        if not result['success']:
+            logger.error(f"Failed to index batch {batch_number}")
+            return None
+        return result['indexed']
+
     def index_all_combinations(self, max_documents: int = -1,
                                force_recreate: bool = False) -> Dict[str, bool]:
         """Index all extraction method and chunking strategy combinations."""
@@ -110,6 +110,22 @@ def test_single_document_processing():
         print(f"Strategy {strategy_name}: {len(result.chunks)} chunks")
 
 
+
+def test_batch_processing_in_worker_processes():
+    """The default pipeline, semantic cache included, runs in a pool."""
+    config = get_default_config()
+    pipeline = ChunkingPipeline(config)
+    
+    document = create_test_document()
+    results = pipeline.process_documents_batch(
+        [document], strategies=['fixed_size'], max_workers=1
+    )
+    
+    result = results[document.document_id]['fixed_size']
+    assert result.success is True
+    assert len(result.chunks) > 0
+
+
 def test_chunking_output_format():
     """Test that chunk output format is correct."""
     config = get_default_config()
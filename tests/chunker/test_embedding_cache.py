@@ -0,0 +1,75 @@
+"""Tests for the persistent semantic-chunking embedding cache."""
+
+import pickle
+
+import numpy as np
+
+from src.chunker.embedding_cache import (
+    CachedEmbeddings, EmbeddingCache, PrefetchedEmbeddings
+)
+
+
+class FakeEmbeddings:
+    """Deterministic embeddings that record which texts were computed."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0, 0.5] for text in texts]
+
+
+def test_cached_embeddings_only_compute_misses(tmp_path):
+    """Second call should only embed texts not seen before."""
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    fake = FakeEmbeddings()
+    embeddings = CachedEmbeddings(fake, cache, "test-model")
+
+    first = embeddings.embed_documents(["alpha", "beta"])
+    second = embeddings.embed_documents(["beta", "gamma", "alpha"])
+
+    assert fake.calls == [["alpha", "beta"], ["gamma"]]
+    assert second[0] == first[1]
+    assert second[2] == first[0]
+    assert np.allclose(second[1], [5.0, 1.0, 0.5])
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """Vectors written by one cache instance are visible to another."""
+    path = tmp_path / "embeddings.db"
+    cache = EmbeddingCache(path)
+    cache.set_many("test-model", ["hello"], np.array([[1.0, 2.0]]))
+    cache.close()
+
+    reopened = EmbeddingCache(path)
+    hit, miss = reopened.get_many("test-model", ["hello", "world"])
+
+    assert miss is None
+    assert hit.dtype == np.float16
+    assert np.allclose(hit, [1.0, 2.0])
+    # Keys are namespaced by model name
+    assert reopened.get_many("other-model", ["hello"]) == [None]
+
+
+def test_prefetched_embeddings_serve_known_texts():
+    """Prefetched texts are returned as-is; only new texts are embedded."""
+    fake = FakeEmbeddings()
+    embeddings = PrefetchedEmbeddings(fake, {"alpha": [9.0, 9.0, 9.0]})
+
+    result = embeddings.embed_documents(["alpha", "gamma", "gamma"])
+
+    assert fake.calls == [["gamma"]]
+    assert result == [[9.0, 9.0, 9.0], [5.0, 1.0, 0.5], [5.0, 1.0, 0.5]]
+
+
+def test_cache_survives_pickling(tmp_path):
+    """A pickled cache, e.g. sent to a worker process, reopens its file."""
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    cache.set_many("test-model", ["hello"], np.array([[1.0, 2.0]]))
+
+    restored = pickle.loads(pickle.dumps(cache))
+
+    assert restored.path == cache.path
+    (hit,) = restored.get_many("test-model", ["hello"])
+    assert np.allclose(hit, [1.0, 2.0])
@@ -0,0 +1,50 @@
+"""Tests for TokenCounter batch counting."""
+
+from src.chunker.base import TokenCounter
+
+
+class FakeEncoder:
+    """Whitespace 'tokenizer' exposing the tiktoken encode API."""
+
+    def __init__(self):
+        self.batch_calls = 0
+
+    def encode(self, text):
+        if "<|endoftext|>" in text:
+            raise ValueError("special token")
+        return text.split()
+
+    def encode_batch(self, texts):
+        self.batch_calls += 1
+        return [self.encode(text) for text in texts]
+
+
+def test_count_tokens_batch_matches_single_counts():
+    """Batch counting should agree with per-text counting."""
+    counter = TokenCounter()
+    counter._encoder = FakeEncoder()
+    texts = ["one two three", "", "four five"]
+
+    assert counter.count_tokens_batch(texts) == [
+        counter.count_tokens(text) for text in texts
+    ]
+    assert counter.encoder.batch_calls == 1
+
+
+def test_count_tokens_batch_falls_back_per_text():
+    """A failing batch should fall back to per-text counting."""
+    counter = TokenCounter()
+    counter._encoder = FakeEncoder()
+
+    counts = counter.count_tokens_batch(["a b", "x <|endoftext|> y z"])
+
+    assert counts == [2, int(4 * 0.75)]
+
+
+def test_count_tokens_batch_fallback_encoder():
+    """Character-based fallback is used when tiktoken is unavailable."""
+    counter = TokenCounter()
+    counter._encoder = "fallback"
+
+    assert counter.count_tokens_batch(["a b c d", ""]) == [3, 0]
+    assert counter.count_tokens_batch([]) == []
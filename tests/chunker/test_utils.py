@@ -0,0 +1,54 @@
+"""Tests for chunking utility helpers."""
+
+from src.chunker.models import DocumentChunk
+from src.chunker.utils import calculate_overlap_positions, merge_small_chunks
+
+
+def test_overlap_positions_respect_max_elements():
+    """Windows use the configured size and overlap, ending at the tail."""
+    elements = [{}] * 50
+
+    positions = calculate_overlap_positions(elements, 0.2, max_elements=20)
+
+    assert positions == [(0, 20), (16, 36), (32, 50)]
+
+
+def test_overlap_positions_single_element_chunks_terminate():
+    """Single-element windows advance instead of looping forever."""
+    elements = [{}] * 3
+
+    positions = calculate_overlap_positions(elements, 0.5, max_elements=1)
+
+    assert positions == [(0, 1), (1, 2), (2, 3)]
+
+
+def _make_chunk(chunk_id, content, document_id="doc"):
+    return DocumentChunk(
+        chunk_id=chunk_id,
+        document_id=document_id,
+        strategy_name="test",
+        content=content,
+        start_position=0,
+        end_position=len(content),
+        token_count=len(content)
+    )
+
+
+def test_merge_small_chunks_merges_runs_in_one_pass():
+    """Adjacent small chunks keep merging until min_size is reached."""
+    chunks = [
+        _make_chunk("a", "x" * 10),
+        _make_chunk("b", "y" * 10),
+        _make_chunk("c", "z" * 10),
+        _make_chunk("d", "w" * 50),
+        _make_chunk("e", "v" * 10, document_id="other"),
+    ]
+
+    merged = merge_small_chunks(chunks, min_size=25)
+
+    assert [chunk.chunk_id for chunk in merged] == ["a", "d", "e"]
+    assert merged[0].metadata['merged_from'] == ["a", "b", "c"]
+    assert merged[0].content == "\n\n".join(["x" * 10, "y" * 10, "z" * 10])
+    assert merged[0].token_count == 30
+    # Inputs are left untouched
+    assert chunks[0].content == "x" * 10
@@ -0,0 +1,200 @@
+"""Tests for the ArXiv downloader's search cache and conditional downloads."""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from src.downloader import arxiv_downloader
+from src.downloader.arxiv_downloader import ArxivDownloader, ArxivPaper
+from src.preprocessor.utils.metadata_extractor import MetadataExtractor
+
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v1</id>
+    <published>2024-01-01T00:00:00Z</published>
+    <title>Attention Is All You Need</title>
+    <summary>The dominant sequence transduction models...</summary>
+    <author><name>Ashish Vaswani</name></author>
+    <link href="http://arxiv.org/pdf/2401.00001v1" type="application/pdf"/>
+    <category term="cs.CL"/>
+  </entry>
+</feed>"""
+
+PAPER = ArxivPaper(
+    arxiv_id="2401.00001",
+    title="Attention Is All You Need",
+    authors=["Ashish Vaswani"],
+    abstract="The dominant sequence transduction models...",
+    categories=["cs.CL"],
+    published=datetime(2024, 1, 1),
+    pdf_url="http://arxiv.org/pdf/2401.00001v1",
+    entry_id="http://arxiv.org/abs/2401.00001v1",
+)
+
+PDF_NAME = "2401.00001_Attention Is All You Need.pdf"
+
+
+@pytest.fixture(autouse=True)
+def clear_downloaded_paths():
+    """Don't let the in-process download cache leak between tests."""
+    arxiv_downloader._DOWNLOADED_PATHS.clear()
+    yield
+    arxiv_downloader._DOWNLOADED_PATHS.clear()
+
+
+def run_with_transport(downloader, handler, coroutine_factory):
+    """Run a downloader call with its HTTP requests sent to handler."""
+    async def run():
+        async with downloader:
+            downloader.session = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            try:
+                return await coroutine_factory()
+            finally:
+                await downloader.session.aclose()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("use_search_cache, expected_requests", [
+    (True, 1),
+    (False, 2),
+])
+def test_search_cache(tmp_path, use_search_cache, expected_requests):
+    """Repeated searches are answered from the cache only when enabled."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=FEED)
+
+    async def search_twice():
+        first = await downloader.search_papers("ti:attention", 1)
+        second = await downloader.search_papers("ti:attention", 1)
+        return first, second
+
+    downloader = ArxivDownloader(tmp_path, use_search_cache=use_search_cache)
+    first, second = run_with_transport(downloader, handler, search_twice)
+
+    assert len(requests) == expected_requests
+    assert [paper.arxiv_id for paper in first] == ["2401.00001"]
+    assert [paper.to_dict() for paper in second] == (
+        [paper.to_dict() for paper in first]
+    )
+
+
+def test_search_cache_is_off_by_default(tmp_path):
+    """Existing callers keep getting fresh results."""
+    assert ArxivDownloader(tmp_path).search_cache is None
+    assert not (tmp_path / ".search_cache.sqlite").exists()
+
+
+def test_revalidate_keeps_file_on_304(tmp_path):
+    """A stored ETag is sent back and a 304 leaves the PDF untouched."""
+    filepath = tmp_path / PDF_NAME
+    filepath.write_bytes(b"%PDF-old")
+    (tmp_path / "2401.00001.etag").write_text('"v1"\n')
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(304)
+
+    downloader = ArxivDownloader(tmp_path, revalidate=True)
+    result = run_with_transport(
+        downloader, handler, lambda: downloader.download_paper(PAPER)
+    )
+
+    assert result == filepath
+    assert [request.headers.get("If-None-Match") for request in requests] == (
+        ['"v1"']
+    )
+    assert filepath.read_bytes() == b"%PDF-old"
+
+
+def test_revalidate_replaces_changed_file(tmp_path):
+    """A 200 replaces the PDF and stores the new ETag."""
+    filepath = tmp_path / PDF_NAME
+    filepath.write_bytes(b"%PDF-old")
+    (tmp_path / "2401.00001.etag").write_text('"v1"')
+
+    def handler(request):
+        return httpx.Response(
+            200, content=b"%PDF-new", headers={"ETag": '"v2"'}
+        )
+
+    downloader = ArxivDownloader(tmp_path, revalidate=True)
+    result = run_with_transport(
+        downloader, handler, lambda: downloader.download_paper(PAPER)
+    )
+
+    assert result == filepath
+    assert filepath.read_bytes() == b"%PDF-new"
+    assert (tmp_path / "2401.00001.etag").read_text() == '"v2"'
+    assert not (tmp_path / (PDF_NAME + ".part")).exists()
+
+
+def test_existing_file_is_skipped_without_revalidate(tmp_path):
+    """Without revalidate, an existing PDF is returned with no request."""
+    filepath = tmp_path / PDF_NAME
+    filepath.write_bytes(b"%PDF-old")
+    (tmp_path / "2401.00001.etag").write_text('"v1"')
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b"%PDF-new")
+
+    downloader = ArxivDownloader(tmp_path)
+    result = run_with_transport(
+        downloader, handler, lambda: downloader.download_paper(PAPER)
+    )
+
+    assert result == filepath
+    assert requests == []
+    assert filepath.read_bytes() == b"%PDF-old"
+
+
+def test_downloaded_file_keeps_title_for_preprocessor(tmp_path):
+    """The preprocessor reads the same metadata as before from new files."""
+    def handler(request):
+        return httpx.Response(200, content=b"%PDF-new")
+
+    downloader = ArxivDownloader(tmp_path)
+    result = run_with_transport(
+        downloader, handler, lambda: downloader.download_paper(PAPER)
+    )
+
+    assert result == tmp_path / PDF_NAME
+    metadata = MetadataExtractor.extract_metadata_from_filename(result)
+    assert "Attention Is All You Need" in metadata["title"]
+    assert MetadataExtractor.generate_document_id(result) == (
+        "240100001_attention_is_all_you_need"
+    )
+
+
+def test_copy_saved_under_old_title_is_reused(tmp_path):
+    """Papers are matched by ArXiv ID, so a revised title isn't refetched."""
+    filepath = tmp_path / "2401.00001_Attention Is All You Need (draft).pdf"
+    filepath.write_bytes(b"%PDF-old")
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b"%PDF-new")
+
+    downloader = ArxivDownloader(tmp_path)
+    result = run_with_transport(
+        downloader, handler, lambda: downloader.download_paper(PAPER)
+    )
+
+    assert result == filepath
+    assert requests == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        filepath.name
+    ]
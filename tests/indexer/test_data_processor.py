@@ -0,0 +1,159 @@
+"""Tests for decoding processed and chunks files into index documents."""
+
+import json
+
+import pytest
+
+# Importing the indexer package pulls in the Typesense client
+pytest.importorskip("typesense")
+
+from src.indexer.data_processor import DataProcessor  # noqa: E402
+
+
+def write_document(tmp_path, document_id="2401.00001", chunks_data=None):
+    """Write a processed document and, optionally, its chunks file."""
+    processed = tmp_path / "processed" / "pypdf"
+    chunks = tmp_path / "chunks"
+    processed.mkdir(parents=True, exist_ok=True)
+    chunks.mkdir(exist_ok=True)
+
+    (processed / f"{document_id}.json").write_text(json.dumps({
+        "document_id": document_id,
+        "title": "Attention Is All You Need",
+        "file_name": f"{document_id}.pdf",
+        # Keys the indexer doesn't read
+        "abstract": "The dominant sequence transduction models...",
+        "full_text": "Abstract\nThe dominant sequence transduction models...",
+        "elements": [{"type": "Title", "text": "Attention"}],
+    }))
+    if chunks_data is not None:
+        chunks_file = chunks / f"{document_id}_pypdf_fixed_size.json"
+        chunks_file.write_text(
+            chunks_data if isinstance(chunks_data, str)
+            else json.dumps(chunks_data)
+        )
+    return DataProcessor(str(tmp_path / "processed"), str(chunks))
+
+
+def chunk(index, **fields):
+    """Build a chunk as written by DocumentChunk.to_dict."""
+    data = {
+        "chunk_id": f"2401.00001_fixed_size_{index}",
+        "document_id": "2401.00001",
+        "strategy_name": "fixed_size",
+        "content": f"Chunk {index} content",
+        "start_position": index * 100,
+        "end_position": index * 100 + 99,
+        "token_count": 25,
+        "metadata": {
+            "chunk_index": index,
+            "total_chunks": 2,
+            "title": "Attention Is All You Need",
+            "authors": ["Ashish Vaswani", "Noam Shazeer"],
+            "source_file": "2401.00001.pdf",
+        },
+        "elements": [],
+        "created_at": "2025-09-01T12:00:00",
+    }
+    data.update(fields)
+    return data
+
+
+def test_decodes_real_shaped_chunks_file(tmp_path):
+    """Known fields are indexed, extra keys ignored, absent metrics omitted."""
+    processor = write_document(tmp_path, chunks_data={
+        "results": {
+            "chunks": [chunk(0), chunk(1, strategy_name=None)],
+            "metrics": {"total_chunks": 2, "avg_chunk_size": 100.0},
+        },
+        "strategy_config": {
+            "name": "fixed_size",
+            "parameters": {"chunk_size": 512, "overlap": 50,
+                           "encoding_name": "cl100k_base"},
+        },
+        "processing_metadata": {"processing_time": 0.25,
+                                "memory_usage_mb": 12.5},
+        "document_info": {"preprocessing_method": "pypdf_clean"},
+        "version": "2.0",
+    })
+
+    documents = processor.prepare_documents_for_indexing(
+        "pypdf", "fixed_size"
+    )
+
+    assert len(documents) == 2
+    first = documents[0]
+    assert first["chunk_id"] == "2401.00001_fixed_size_0"
+    assert first["document_id"] == "2401.00001"
+    assert first["document_title"] == "Attention Is All You Need"
+    assert first["document_filename"] == "2401.00001.pdf"
+    assert first["strategy_name"] == "fixed_size"
+    assert first["chunk_index"] == 0
+    assert first["total_chunks"] == 2
+    assert first["end_position"] == 99
+    assert first["authors"] == ["Ashish Vaswani", "Noam Shazeer"]
+    assert first["preprocessing_method"] == "pypdf_clean"
+    assert first["chunk_size"] == 512
+    assert first["chunk_overlap"] == 50
+    assert first["encoding_name"] == "cl100k_base"
+
+    # Only metrics present in the file are indexed
+    assert first["processing_time"] == 0.25
+    for absent in ("content_length", "memory_usage", "cpu_usage_percent",
+                   "gpu_usage_percent"):
+        assert absent not in first
+
+    # An explicit null strategy_name is kept, as with the old dict access
+    assert documents[1]["strategy_name"] is None
+
+
+def test_defaults_for_minimal_chunks_file(tmp_path):
+    """Missing optional sections fall back to the old dict.get defaults."""
+    processor = write_document(tmp_path, chunks_data={
+        "results": {"chunks": [{"chunk_id": "c0", "content": "text"}]},
+    })
+
+    (document,) = processor.prepare_documents_for_indexing(
+        "pypdf", "fixed_size"
+    )
+
+    assert document["strategy_name"] == "fixed_size"
+    assert document["preprocessing_method"] == "pypdf"
+    assert document["token_count"] == 0
+    assert "authors" not in document
+    assert "chunk_size" not in document
+    assert "processing_time" not in document
+
+
+@pytest.mark.parametrize("chunks_data", [
+    "{not json",
+    {"strategy_config": {}},
+    {"results": {}},
+    {"results": {"chunks": "not a list"}},
+])
+def test_malformed_chunks_files_are_skipped(tmp_path, chunks_data):
+    """Unparseable or structurally invalid chunks files yield nothing."""
+    processor = write_document(tmp_path, chunks_data=chunks_data)
+    chunks_file = processor.get_chunks_file(
+        "2401.00001", "pypdf", "fixed_size"
+    )
+
+    assert processor.load_chunks_data(chunks_file) is None
+    assert processor.prepare_documents_for_indexing(
+        "pypdf", "fixed_size"
+    ) == []
+
+
+def test_malformed_processed_files_are_skipped(tmp_path):
+    """A broken processed file is skipped; the others are still indexed."""
+    processor = write_document(tmp_path, chunks_data={
+        "results": {"chunks": [{"chunk_id": "c0", "content": "text"}]},
+    })
+    broken = tmp_path / "processed" / "pypdf" / "broken.json"
+    broken.write_text("{not json")
+
+    assert processor.load_processed_document(broken) is None
+    documents = processor.prepare_documents_for_indexing(
+        "pypdf", "fixed_size"
+    )
+    assert [document["chunk_id"] for document in documents] == ["c0"]
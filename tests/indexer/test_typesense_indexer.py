@@ -0,0 +1,214 @@
+"""Tests for the Typesense indexer's batch import pipeline."""
+
+import json
+import logging
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+typesense = pytest.importorskip("typesense")
+
+from src.indexer.config import IndexerConfig  # noqa: E402
+from src.indexer.typesense_indexer import TypesenseIndexer  # noqa: E402
+
+
+def make_indexer(tmp_path, **config):
+    """Build an indexer whose Typesense client is a mock."""
+    config = IndexerConfig(
+        processed_data_path=str(tmp_path / "processed"),
+        chunks_data_path=str(tmp_path / "chunks"),
+        embedding_cache_path='',
+        **config
+    )
+    with patch("typesense.Client"):
+        indexer = TypesenseIndexer(config)
+
+    # No model or server: fixed-size embeddings, an existing empty collection
+    indexer.embedding_generator.encode = lambda texts: np.zeros(
+        (len(texts), 3), dtype=np.float32
+    )
+    indexer.embedding_generator.get_embedding_dimensions = lambda: 3
+    indexer.collection_manager.create_collection = (
+        lambda *args, **kwargs: True
+    )
+    indexer.client.collections["c"].documents.export.return_value = ""
+    return indexer
+
+
+def write_corpus(tmp_path, files, chunks_per_file):
+    """Write processed and chunks files for the pypdf/fixed_size pair.
+
+    Returns:
+        The chunk_ids in the order they should be indexed
+    """
+    processed = tmp_path / "processed" / "pypdf"
+    chunks = tmp_path / "chunks"
+    processed.mkdir(parents=True)
+    chunks.mkdir()
+
+    chunk_ids = []
+    for i in range(files):
+        document_id = f"doc{i:03d}"
+        (processed / f"{document_id}.json").write_text(json.dumps({
+            "document_id": document_id,
+            "title": f"Title {i}",
+            "file_name": f"{document_id}.pdf"
+        }))
+        ids = [f"{document_id}_{j}" for j in range(chunks_per_file)]
+        (chunks / f"{document_id}_pypdf_fixed_size.json").write_text(
+            json.dumps({"results": {"chunks": [
+                {"chunk_id": chunk_id, "content": f"content {chunk_id}"}
+                for chunk_id in ids
+            ]}})
+        )
+        chunk_ids.extend(ids)
+    return chunk_ids
+
+
+def payload_documents(payload):
+    """Decode the documents of an import payload."""
+    if isinstance(payload, list):
+        return payload
+    return [json.loads(line) for line in payload.splitlines()]
+
+
+def import_results(payload, succeed=True):
+    """Build the import endpoint's response for a payload."""
+    if isinstance(payload, list):
+        return [{"success": succeed} for _ in payload]
+    return "\n".join(
+        json.dumps({"success": succeed}) for _ in payload.splitlines()
+    )
+
+
+def payload_size(payload):
+    """Count the documents in an import payload."""
+    if isinstance(payload, list):
+        return len(payload)
+    return len(payload.splitlines())
+
+
+def test_import_splits_batches_rejected_as_too_large(tmp_path):
+    """HTTP 413 responses are retried as two halves, recursively."""
+    indexer = make_indexer(tmp_path)
+    sizes = []
+
+    def import_(payload, params):
+        sizes.append(payload_size(payload))
+        if payload_size(payload) > 2:
+            raise typesense.exceptions.TypesenseClientError(
+                413, "Request Entity Too Large"
+            )
+        return import_results(payload)
+
+    indexer.client.collections["c"].documents.import_.side_effect = import_
+    documents = [{"chunk_id": str(i)} for i in range(5)]
+
+    result = indexer.index_documents("c", documents)
+
+    assert result == {"success": True, "indexed": 5, "errors": 0}
+    assert sizes == [5, 2, 3, 1, 2]
+
+
+def test_import_does_not_retry_other_errors(tmp_path):
+    """Errors other than 413 fail the batch without splitting it."""
+    indexer = make_indexer(tmp_path)
+    import_ = indexer.client.collections["c"].documents.import_
+    import_.side_effect = typesense.exceptions.TypesenseClientError(
+        500, "Internal Server Error"
+    )
+
+    result = indexer.index_documents("c", [{"chunk_id": "0"}] * 4)
+
+    assert result["success"] is False
+    assert import_.call_count == 1
+
+
+def test_pipeline_preserves_batches_and_order(tmp_path, caplog):
+    """With the thread pool active, batches are full and in corpus order."""
+    chunk_ids = write_corpus(tmp_path, files=6, chunks_per_file=3)
+    indexer = make_indexer(tmp_path, batch_size=5)
+    batches = []
+
+    def import_(payload, params):
+        batches.append(
+            [doc["chunk_id"] for doc in payload_documents(payload)]
+        )
+        return import_results(payload)
+
+    indexer.client.collections["c"].documents.import_.side_effect = import_
+
+    with caplog.at_level(logging.INFO):
+        assert indexer.index_extraction_method_strategy(
+            "pypdf", "fixed_size"
+        )
+
+    assert [len(batch) for batch in batches] == [5, 5, 5, 3]
+    assert sum(batches, []) == chunk_ids
+    # The last upload, still pending when the stream ends, is counted
+    assert "Successfully indexed 18 documents" in caplog.text
+
+
+@pytest.mark.parametrize("failing_batch", [2, 4])
+def test_pipeline_stops_on_failed_upload(tmp_path, failing_batch):
+    """A failed upload, including the last pending one, returns False."""
+    write_corpus(tmp_path, files=6, chunks_per_file=3)
+    indexer = make_indexer(tmp_path, batch_size=5)
+    calls = []
+
+    def import_(payload, params):
+        calls.append(payload)
+        return import_results(payload, succeed=len(calls) != failing_batch)
+
+    indexer.client.collections["c"].documents.import_.side_effect = import_
+
+    assert not indexer.index_extraction_method_strategy(
+        "pypdf", "fixed_size"
+    )
+    # Nothing is uploaded after the failed batch
+    assert len(calls) == failing_batch
+
+
+def test_already_indexed_chunks_are_skipped(tmp_path):
+    """Chunks exported from the collection are neither embedded nor sent."""
+    chunk_ids = write_corpus(tmp_path, files=2, chunks_per_file=3)
+    indexer = make_indexer(tmp_path)
+    documents = indexer.client.collections["c"].documents
+    documents.export.return_value = "\n".join(
+        json.dumps({"chunk_id": chunk_id}) for chunk_id in chunk_ids[:4]
+    )
+    documents.import_.side_effect = import_results
+
+    encode = indexer.embedding_generator.encode
+    embedded = []
+    indexer.embedding_generator.encode = (
+        lambda texts: embedded.extend(texts) or encode(texts)
+    )
+
+    assert indexer.index_extraction_method_strategy("pypdf", "fixed_size")
+
+    documents.export.assert_called_once_with({"include_fields": "chunk_id"})
+    (payload, _), _ = documents.import_.call_args
+    assert [doc["chunk_id"] for doc in payload_documents(payload)] == (
+        chunk_ids[4:]
+    )
+    assert embedded == [
+        f"Title 1. content {chunk_id}" for chunk_id in chunk_ids[4:]
+    ]
+
+
+def test_force_recreate_skips_the_export(tmp_path):
+    """A recreated collection is empty, so existing ids aren't fetched."""
+    chunk_ids = write_corpus(tmp_path, files=2, chunks_per_file=3)
+    indexer = make_indexer(tmp_path)
+    documents = indexer.client.collections["c"].documents
+    documents.import_.side_effect = import_results
+
+    assert indexer.index_extraction_method_strategy(
+        "pypdf", "fixed_size", force_recreate=True
+    )
+
+    documents.export.assert_not_called()
+    (payload, _), _ = documents.import_.call_args
+    assert len(payload_documents(payload)) == len(chunk_ids)